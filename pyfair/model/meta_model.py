@@ -90,14 +90,27 @@ class FairMetaModel(object):
 
         return self._model_uuid
 
+    def get_creation_date(self):
+        """Returns the model's creation date.
+
+        Returns
+        -------
+        str
+            The creation date of the model.
+
+        """
+
+        return self._creation_date
+
     @staticmethod
     def read_json(json_data):
         """Static method to create a metamodel from a JSON string
 
         Parameters
         ----------
-        json_data : str
-            a UTF-8 encoded JSON string containing model data
+        json_data : str or dict
+            a UTF-8 encoded JSON string containing model data, or the
+            dict already parsed from such a string
 
         Returns
         -------
@@ -117,7 +130,11 @@ class FairMetaModel(object):
         >>> metamodel = pyfair.model.FairMetaModel.read_json(json_text)
 
         """
-        data = json.loads(json_data)
+        # Skip parsing if the caller already has the data
+        if isinstance(json_data, dict):
+            data = json_data
+        else:
+            data = json.loads(json_data)
         # Check type of JSON
         if data['type'] != 'FairMetaModel':
             raise FairException('Failed JSON parse attempt. This is not a FairMetaModel.')
@@ -132,7 +149,7 @@ class FairMetaModel(object):
         # metamodels here because metamodel json only
         # has models in it, not metamodels.
         models = [
-            FairModel.read_json(json.dumps(value))
+            FairModel.read_json(value)
             for value
             in model_params.values()
         ]
@@ -161,9 +178,8 @@ class FairMetaModel(object):
         }
         # Iterate through params
         for model_params in params.values():
-            # If model, load model from json and load into meta
-            model_json = json.dumps(model_params)
-            model = FairModel.read_json(model_json)
+            # If model, load model from its params and load into meta
+            model = FairModel.read_json(model_params)
             self._load_model(model)
 
     def _record_params(self, model):
@@ -175,8 +191,7 @@ class FairMetaModel(object):
     def _calculate_model(self, model):
         """Calculate a component models"""
         # For each model, calculate and put output results in dataframe.
-        model_json = json.loads(model.to_json())
-        name = model_json['name']
+        name = str(model.get_name())
         model.calculate_all()
         results = model.export_results()
         self._risk_table[name] = results['Risk']
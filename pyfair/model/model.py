@@ -93,8 +93,7 @@ class FairModel(object):
             self._model_uuid  = model_uuid
             self._creation_date = creation_date
         else:
-            self._model_uuid = str(uuid.uuid1())
-            self._creation_date = str(datetime.datetime.now())
+            self._reset_identity(name)
         # Standardized targets for abbreviation use
         self._target_map = {
             'LEF' : 'Loss Event Frequency',
@@ -123,8 +122,9 @@ class FairModel(object):
 
         Parameters
         ----------
-        param_json : str
-            a UTF-8 encoded JSON string containing model data
+        param_json : str or dict
+            a UTF-8 encoded JSON string containing model data, or the
+            dict already parsed from such a string
 
         Returns
         -------
@@ -144,7 +144,11 @@ class FairModel(object):
         >>> model = FairModel.read_json(json_text)
 
         """
-        data = json.loads(param_json)
+        # Skip parsing if the caller already has the data
+        if isinstance(param_json, dict):
+            data = param_json
+        else:
+            data = json.loads(param_json)
         # Check type of JSON
         if data['type'] != 'FairModel':
             raise FairException('Failed JSON parse attempt. This is not a FairModel.')
@@ -229,6 +233,17 @@ class FairModel(object):
         """
         return self._model_uuid
 
+    def get_creation_date(self):
+        """Returns the model's creation date.
+
+        Returns
+        -------
+        str
+            The creation date of the model.
+
+        """
+        return self._creation_date
+
     def calculation_completed(self):
         """Public method to check completion status of dependency tree
 
@@ -331,8 +346,9 @@ class FairModel(object):
     def bulk_import_data(self, param_dictionary):
         """Takes multiple inputs via nested dictionaries.
 
-        The function iterates through a dictionary and runs input_data()
-        for each item. This allows for multiple items to be added at a 
+        The function is equivalent to running input_data() for each item
+        in the dictionary, but BetaPert inputs are generated together in a
+        single batch. This allows for multiple items to be added at a 
         single time. The param dictionary will take the form:
 
         {'target_1': {param_1: value_1}, 'target_2': {param_2: value_2}}
@@ -347,6 +363,12 @@ class FairModel(object):
         pyfair.model.FairModel
             A reference to this object of type FairModel
 
+        Raises
+        ------
+        pyfair.fair_exception.FairException
+            If any of the parameters are invalid (in which case nothing is
+            input), or if two keys refer to the same target
+
         Examples
         --------
         >>> model = pyfair.FairModel(name="Insider Threat")
@@ -356,9 +378,21 @@ class FairModel(object):
         ... })
 
         """
-        # Iterate through each key, value pair and run through input_data()
+        # Standardize inputs to account for abbreviations
+        standardized_params = {}
         for target, parameters in param_dictionary.items():
-            self.input_data(target, **parameters)
+            standard_target = self._standardize_target(target)
+            # e.g. 'LEF' and 'Loss Event Frequency' in the same dict
+            if standard_target in standardized_params:
+                raise FairException('"{}" is supplied more than once.'.format(standard_target))
+            standardized_params[standard_target] = parameters
+        param_dictionary = standardized_params
+        # Generate all data via data captive class
+        data = self._data_input.generate_bulk(param_dictionary, self._n_simulations)
+        # Update dependency tracker and model table for each target
+        for target, values in data.items():
+            self._tree.update_status(target, 'Supplied')
+            self._model_table[target] = values
         return self
 
     def input_raw_data(self, target, array):
@@ -417,6 +451,12 @@ class FairModel(object):
         self._model_table[target] = data
         return self
 
+    def _reset_identity(self, name):
+        """Give the model a name, a new UUID, and a new creation date"""
+        self._name = name
+        self._model_uuid = str(uuid.uuid1())
+        self._creation_date = str(datetime.datetime.now())
+
     def _standardize_target(self, target):
         """A function to change target abbreviations into full names"""
         if target in self._target_map.keys():
@@ -34,11 +34,11 @@ class FairCalculations(object):
             A string describing a node, which is used with the
             _function_dict member to look up the appropriate function.
 
-        child_1_data : pd.Series
+        child_1_data : pd.Series or np.ndarray
             An input vector that is combined with child_2_data with a step,
             addtion, or multiplication function.
 
-        child_2_data : pd.Series
+        child_2_data : pd.Series or np.ndarray
             An input vector that is combined with child_1_data with a step,
             addtion, or multiplication function.
 
@@ -50,36 +50,39 @@ class FairCalculations(object):
         -------
         pd.Series
             A single series that is the product of the child data inputs
-            and the function chose by the parent_name.
+            and the function chose by the parent_name. It keeps the index
+            of child_1_data if it has one.
 
         """
         target_function = self._function_dict[parent_name]
-        calculated_result = target_function(child_1_data, child_2_data)
-        return calculated_result
+        # Work on the raw arrays to skip pandas alignment and dispatch
+        index = getattr(child_1_data, 'index', None)
+        calculated_result = target_function(
+            np.asarray(child_1_data),
+            np.asarray(child_2_data)
+        )
+        # And put it in a series only once at the end
+        return pd.Series(calculated_result, index=index, copy=False)
 
     def _calculate_step_average(self, child_1_data, child_2_data):
-        """Get bool series based on step function, then average for vuln"""
+        """Get bool array based on step function, then average for vuln"""
         # Get Trues (1) where child_2 (TCap) is greater than child_1 (CS)
         # Otherwise False (0)
-        bool_series = child_1_data < child_2_data
-        # Treat those bools as 1 and 0 and get mean
-        bool_scalar_average = bool_series.mean()
+        bool_array = child_1_data < child_2_data
+        # Treat those bools as 1 and 0 and get mean (counting set values
+        # directly rather than converting the bools to floats first)
+        bool_scalar_average = np.count_nonzero(bool_array) / len(bool_array)
         # Create a long array of that mean
         vuln_data = np.full(
-            len(bool_series),
+            len(bool_array),
             bool_scalar_average
         )
-        # And put it in a series
-        vuln = pd.Series(
-            data=vuln_data,
-            index=bool_series.index
-        )
-        return vuln
+        return vuln_data
 
     def _calculate_addition(self, child_1_data, child_2_data):
-        """Calculate sum of two columns"""
-        return child_1_data + child_2_data
+        """Calculate sum of two arrays"""
+        return np.add(child_1_data, child_2_data)
 
     def _calculate_multiplication(self, child_1_data, child_2_data):
-        """Calculate product of two columns"""
-        return child_1_data * child_2_data
+        """Calculate product of two arrays"""
+        return np.multiply(child_1_data, child_2_data)
@@ -1,7 +1,5 @@
 """This module contains an input object for sanitizing / checking data."""
 
-import scipy.stats
-
 import numpy as np
 import pandas as pd
 
@@ -20,7 +18,7 @@ class FairDataInput(object):
 
     The shape of the distribution for the random variates is inferred from
     the keywords (self._parameter_map), and the restrictions around whether
-    numbers are inferred from the the targets (self._le_1_targets). These
+    numbers are inferred from the the targets (self._LE_1_TARGETS). These
     are both analyzed when an external actor triggers generate(). Other
     checks are run as necessary.
 
@@ -29,10 +27,13 @@ class FairDataInput(object):
     is stored when converting to JSON or another serialization format.
 
     """
+    # These targets must be less than or equal to one
+    _LE_1_TARGETS = frozenset(['Probability of Action', 'Vulnerability', 'Control Strength', 'Threat Capability'])
+    _LE_1_KEYWORDS = frozenset(['constant', 'high', 'mode', 'low', 'mean'])
+    # These keywords must not be less than zero
+    _NON_NEGATIVE_KEYWORDS = frozenset(['mean', 'constant', 'low', 'mode', 'high'])
+
     def __init__(self):
-        # These targets must be less than or equal to one
-        self._le_1_targets = ['Probability of Action', 'Vulnerability', 'Control Strength', 'Threat Capability']
-        self._le_1_keywords = ['constant', 'high', 'mode', 'low', 'mean']
         # Parameter map associates parameters with functions
         self._parameter_map = {
             'constant': self._gen_constant,
@@ -43,11 +44,11 @@ class FairDataInput(object):
             'mean'    : self._gen_normal,
             'stdev'   : self._gen_normal,
         }
-        # List of keywords with function keys
+        # Set of keywords with function keys
         self._required_keywords = {
-            self._gen_constant: ['constant'],
-            self._gen_pert    : ['low', 'mode', 'high'],
-            self._gen_normal  : ['mean', 'stdev'],
+            self._gen_constant: frozenset(['constant']),
+            self._gen_pert    : frozenset(['low', 'mode', 'high']),
+            self._gen_normal  : frozenset(['mean', 'stdev']),
         }  
         # Storage of inputs
         self._supplied_values = {}
@@ -71,8 +72,8 @@ class FairDataInput(object):
         # For every keyword argument
         for key, value in kwargs.items():
             # Set boolean conditions
-            applicable_keyword = key in self._le_1_keywords
-            applicable_target = target in self._le_1_targets
+            applicable_keyword = key in self._LE_1_KEYWORDS
+            applicable_target = target in self._LE_1_TARGETS
             # If key is in specified list
             if applicable_keyword and applicable_target:
                 # Check if value is less than or equal to 1
@@ -94,17 +95,15 @@ class FairDataInput(object):
         for keyword, value in kwargs.items():
             # Two conditions
             value_is_less_than_zero = value < 0
-            keyword_is_relevant = keyword in ['mean', 'constant', 'low', 'mode', 'high']
+            keyword_is_relevant = keyword in self._NON_NEGATIVE_KEYWORDS
             # Test conditions
             if keyword_is_relevant and value_is_less_than_zero:
                 raise FairException('"{}" is less than zero.'.format(keyword))
         # Check that all required keywords are provided
         required_keywords = self._required_keywords[target_function]
-        for required_keyword in required_keywords:
-            if required_keyword in kwargs.keys():
-                pass
-            else:
-                raise FairException('"{}" is missing "{}".'.format(str(target_function), required_keyword))
+        if not kwargs.keys() >= required_keywords:
+            missing_keywords = sorted(required_keywords - kwargs.keys())
+            raise FairException('"{}" is missing "{}".'.format(str(target_function), '", "'.join(missing_keywords)))
 
     def generate(self, target, count, **kwargs):
         """Executes request, records parameters, and return random values
@@ -152,6 +151,80 @@ class FairDataInput(object):
         self._supplied_values[target] = {**kwargs}
         return result
 
+    def generate_bulk(self, param_dictionary, count):
+        """Executes several requests, drawing BetaPert targets in batches
+
+        This is equivalent to calling `generate()` for each target in
+        order, except that runs of consecutive BetaPert targets are drawn
+        with a single FairBetaPert.sample_batch() call. Because the batch
+        draws each target's values in order, the random values are the
+        same as those generated one target at a time. Every target is
+        checked before anything is drawn, and parameters are only recorded
+        once all targets have been generated.
+
+        Parameters
+        ----------
+        param_dictionary : dict
+            A nested dictionary of parameters taking the form
+            {'target_1': {param_1: value_1}, 'target_2': {param_2: value_2}}
+        count : int
+            The number of random numbers generated for each target
+
+        Raises
+        ------
+        pyfair.utility.fair_exception.FairException
+            Raised for the same reasons as `generate()`
+
+        Returns
+        -------
+        dict
+            A dictionary with targets as keys and arrays of length `count`
+            as values
+
+        """
+        # Check every target before anything is drawn or recorded
+        for target, kwargs in param_dictionary.items():
+            func = self._determine_func(**kwargs)
+            self._check_inputs(target, func, **kwargs)
+            if func == self._gen_pert:
+                self._check_pert(**kwargs)
+        results = {}
+        supplied_values = {}
+        pending = {}
+        for target, kwargs in param_dictionary.items():
+            if self._determine_func(**kwargs) == self._gen_pert:
+                # Draw with the rest of the batch later
+                pending[target] = {**kwargs}
+                pending[target].setdefault('gamma', 4)
+                supplied_values[target] = pending[target]
+            else:
+                # Flush the batch first to keep the random stream in order
+                results.update(self._generate_pert_batch(pending, count))
+                pending = {}
+                results[target] = self._generate_single(target, count, **kwargs)
+                supplied_values[target] = {**kwargs}
+        results.update(self._generate_pert_batch(pending, count))
+        # Only record parameters once all targets have been generated
+        self._supplied_values.update(supplied_values)
+        return results
+
+    def _generate_pert_batch(self, pending, count):
+        """Draws and clips a batch of BetaPert targets"""
+        if not pending:
+            return {}
+        variates = FairBetaPert.sample_batch(
+            [kwargs['low'] for kwargs in pending.values()],
+            [kwargs['mode'] for kwargs in pending.values()],
+            [kwargs['high'] for kwargs in pending.values()],
+            count,
+            [kwargs['gamma'] for kwargs in pending.values()],
+        )
+        return {
+            target: self._clip(target, row)
+            for target, row
+            in zip(pending, variates)
+        }
+
     def _generate_single(self, target, count, **kwargs):
         """Internal workhorse function for single request
 
@@ -161,22 +234,32 @@ class FairDataInput(object):
         of the result of the RNG function, and returns the result.
 
         """
+        # Figure out what function
+        func = self._determine_func(**kwargs)
+        # Check value ranges and that sufficient parameters exist
+        self._check_inputs(target, func, **kwargs)
+        # Run the function
+        results = func(count, **kwargs)
+        return self._clip(target, results)
+
+    def _check_inputs(self, target, func, **kwargs):
+        """Runs the le_1 and parameter checks for a target"""
         # If destined for a le_1_target, check validity.
-        if target in self._le_1_targets:
+        if target in self._LE_1_TARGETS:
             self._check_le_1(target, **kwargs)
-        # Otherwise figure out what function
-        func = self._determine_func(**kwargs)
         # Check to make sure sufficient parameters exist
         self._check_parameters(func, **kwargs)
-        # Run the function
-        results = func(count, **kwargs)
+
+    def _clip(self, target, results):
+        """Clips results to the range appropriate for the target"""
+        # Fresh float draws can be clipped in place without a temporary
+        out = results if results.dtype == np.float64 else None
         # Clip if in le_1_targets
-        if target in self._le_1_targets:
-            results = np.clip(results, 0.0, 1.0)
+        if target in self._LE_1_TARGETS:
+            return np.clip(results, 0.0, 1.0, out=out)
         # Otherwise ensure simply above zero
         else:
-            results = np.clip(results, 0.0, np.inf)
-        return results
+            return np.clip(results, 0.0, np.inf, out=out)
 
     def generate_multi(self, prefixed_target, count, kwargs_dict):
         """Generates aggregate risk data for multiple targets
@@ -243,22 +326,24 @@ class FairDataInput(object):
         """
         # Remove prefix from target
         final_target = prefixed_target.lstrip('multi_')
-        # Create a container for dataframes
-        df_dict = {target: pd.DataFrame() for target in kwargs_dict.keys()}
+        # Columns are matched by name in the order given for the first target
+        columns = list(next(iter(kwargs_dict.values()), {}))
+        # One contiguous block of (target, column, simulation) values
+        data = np.empty((len(kwargs_dict), len(columns), count))
         # For each target
-        for target, column_dict in kwargs_dict.items():
+        for target_idx, (target, column_dict) in enumerate(kwargs_dict.items()):
+            if set(column_dict) != set(columns):
+                raise FairException('"{}" does not have columns {}.'.format(target, columns))
             # For each column in that target
             for column, params in column_dict.items():
-                # Gen data
-                data = self._generate_single(target, count, **params)
-                s = pd.Series(data)
-                # Put in dict
-                df_dict[target][column] = s
+                # Gen data straight into its row
+                column_idx = columns.index(column)
+                data[target_idx, column_idx] = self._generate_single(target, count, **params)
         # Multiply
-        df1, df2 = df_dict.values()
-        combined_df = df1 * df2
+        data_1, data_2 = data
+        combined = data_1 * data_2
         # Sum
-        summed = combined_df.sum(axis=1)
+        summed = pd.Series(combined.sum(axis=0))
         # Record params
         new_target = 'multi_' + final_target
         self._supplied_values[new_target] = kwargs_dict
@@ -299,7 +384,7 @@ class FairDataInput(object):
         if s.isnull().any():
             raise FairException('Supplied data contains null values')
         # Ensure values are appropriate
-        if target in self._le_1_targets:
+        if target in self._LE_1_TARGETS:
             if s.max() > 1 or s.min() < 0:
                 raise FairException(f'{target} data greater or less than one')
         self._supplied_values[target] = {'raw': s.values.tolist()}
@@ -329,8 +414,8 @@ class FairDataInput(object):
 
     def _gen_normal(self, count, **kwargs):
         """Geneates random normally-distributed array of size `count`"""
-        normal = scipy.stats.norm(loc=kwargs['mean'], scale=kwargs['stdev'])
-        rvs = normal.rvs(count)
+        # Same draws as scipy.stats.norm.rvs() without the frozen dist
+        rvs = np.random.normal(kwargs['mean'], kwargs['stdev'], count)
         return rvs
 
     def _gen_pert(self, count, **kwargs):
@@ -31,6 +31,9 @@ class FairDependencyNode(object):
         'Required').
 
     """
+    # Every model creates a full tree of these, so skip the instance dict
+    __slots__ = ('name', 'parent', 'children', 'status')
+
     def __init__(self, name):
         self.name     = name
         self.parent   = None
@@ -58,6 +58,9 @@ class FairDependencyTree(object):
         self._root = self.nodes['Risk']
         self._link_nodes()
         self._obtain_leaf_nodes(self._root)
+        # The shape is fixed, so record the status traversal order once
+        self._status_order = []
+        self._obtain_status_order(self._root)
 
     def ready_for_calculation(self):
         """Ensure there are no required items remaining
@@ -130,14 +133,14 @@ class FairDependencyTree(object):
             # Let child nodes know they are no longer required
             for child_node in node.children:
                 self._propogate_down(child_node)
-            # Let parent nodes know they should check for their deps
-            for node in self._leaf_nodes:
-                self._propogate_up(node)
+            # Let parent nodes know they should check for their deps. Only
+            # this node's ancestors can have had a child become available.
+            self._propogate_up(node)
         # Calculated status requires no propogation
         if new_status == 'Calculated':
             node.status = 'Calculated'
         # Update node status dict
-        self._obtain_status(self._root)
+        self._obtain_status()
 
     def get_node_statuses(self):
         """Simple getter to obtain node statuses.
@@ -179,16 +182,26 @@ class FairDependencyTree(object):
         nodes['Secondary Loss'].add_child(nodes['Secondary Loss Event Frequency'])
         nodes['Secondary Loss'].add_child(nodes['Secondary Loss Event Magnitude'])
 
-    def _obtain_status(self, node):
-        """Traverse the tree and record the statuses
+    def _obtain_status(self):
+        """Record the statuses in precomputed traversal order
 
         This is a helper function to update the dict of statuses after
         changes are made via update_status.
 
         """
-        self._node_statuses[node.name] = node.status
-        for node in node.children:
-            self._obtain_status(node)
+        for node in self._status_order:
+            self._node_statuses[node.name] = node.status
+
+    def _obtain_status_order(self, node):
+        """Traverse the tree and record the order of the nodes
+
+        Only run once, at time of __init__(). Statuses are later read in
+        this order by _obtain_status().
+
+        """
+        self._status_order.append(node)
+        for child_node in node.children:
+            self._obtain_status_order(child_node)
 
     def _obtain_leaf_nodes(self, node):
         """Traverse the tree and record the leaf nodes. 
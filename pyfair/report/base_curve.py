@@ -1,5 +1,7 @@
 """This contains a subclass for curves used in reporting"""
 
+from ..model.model import FairModel
+from ..model.meta_model import FairMetaModel
 from ..utility.fair_exception import FairException
 
 
@@ -13,6 +15,8 @@ class FairBaseCurve(object):
     consequently raises a NotImplementedError.
 
     """
+    # Types accepted as models by _input_check()
+    _MODEL_TYPES = (FairModel, FairMetaModel)
 
     def _input_check(self, value):
         """Checks the input for compatability with curve
@@ -26,7 +30,7 @@ class FairBaseCurve(object):
         """
         # If it's a model or metamodel, plug it in a dict.
         rv = {}
-        if value.__class__.__name__ in ['FairModel', 'FairMetaModel']:
+        if isinstance(value, self._MODEL_TYPES):
             rv[value.get_name()] = value
             return rv
         # Check for iterable. If not, raise error.
@@ -38,7 +42,7 @@ class FairBaseCurve(object):
                 raise FairException('Input is an empty iterable.')
         # Iterate and process remainder.
         for proported_model in value:
-            if proported_model.__class__.__name__ in ['FairModel', 'FairMetaModel']:
+            if isinstance(proported_model, self._MODEL_TYPES):
                 rv[proported_model.get_name()] = proported_model
             else:
                 raise FairException('Iterable member is not a FairModel or FairMetaModel')
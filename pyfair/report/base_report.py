@@ -3,11 +3,11 @@
 import base64
 import datetime
 import getpass
-import inspect
+import html
 import io
-import os
 import pathlib
 
+import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 
@@ -16,10 +16,18 @@ from .. import VERSION
 from .tree_graph import FairTreeGraph
 from .distribution import FairDistributionCurve
 from .exceedence import FairExceedenceCurves
+from ..model.model import FairModel
+from ..model.meta_model import FairMetaModel
 from ..utility.fair_exception import FairException
 from .violin import FairViolinPlot
 
 
+def _base64_img_tag(binary_data, alternative_text='', options=''):
+    """Encode binary PNG data as an <img> tag (see base64ify())"""
+    base64_string = base64.b64encode(binary_data).decode('utf8')
+    return f'<img {options} src="data:image/png;base64, {base64_string}" alt="{alternative_text}"/>'
+
+
 class FairBaseReport(object):
     """A base class for creating FairModel and FairMetaModel reports
 
@@ -29,10 +37,19 @@ class FairBaseReport(object):
     instantiated on its own.
 
     """
+    # Static assets are read and encoded once at import, not per report
+    _STATIC_LOCATION = pathlib.Path(__file__).parent.parent / 'static'
+    _STATIC_CSS = (_STATIC_LOCATION / 'fair.css').read_text()
+    _STATIC_TEMPLATES = {
+        'simple': (_STATIC_LOCATION / 'simple.html').read_text(),
+    }
+    _LOGO_TAG = _base64_img_tag((_STATIC_LOCATION / 'white_python_logo.png').read_bytes())
+
     def __init__(self, currency_prefix='$'):
         # Add formatting strings
         self._currency_prefix = currency_prefix
         self._model_or_models = None
+        self._metadata_table = None
         self._currency_format_string     = currency_prefix + '{0:,.0f}'
         self._float_format_string      = '{0:.2f}'
         self._format_strings = {
@@ -50,14 +67,6 @@ class FairBaseReport(object):
             'Secondary Loss Event Frequency' : self._float_format_string,
             'Secondary Loss Event Magnitude' : self._currency_format_string,
         }
-        # Add locations
-        self._fair_location = pathlib.Path(__file__).parent.parent
-        self._static_location = self._fair_location / 'static'
-        self._logo_location = self._static_location / 'white_python_logo.png'
-        self._template_paths = {
-            'css'   : self._static_location / 'fair.css',
-            'simple': self._static_location / 'simple.html'
-        }
         self._param_cols = [
             'low',
             'most_likely',
@@ -75,19 +84,18 @@ class FairBaseReport(object):
             If an inappropriate object or iterable of objects is supplied
         """
         # If it's a model or metamodel, plug it in a dict.
-        rv = {}
-        if value.__class__.__name__ in ['FairModel', 'FairMetaModel']:
-            rv[value.get_name()] = value
-            return rv
+        if isinstance(value, (FairModel, FairMetaModel)):
+            return {value.get_name(): value}
         # Check for iterable.
         if not hasattr(value, '__iter__'):
             raise FairException('Input is not a FairModel, FairMetaModel, or an iterable.')
         if len(value) == 0:
             raise FairException('Empty iterable where iterable of models expected.')
         # Iterate and process remainder.
+        rv = {}
         for proported_model in value:
             # Check if model
-            if proported_model.__class__.__name__ in ['FairModel', 'FairMetaModel']:
+            if isinstance(proported_model, (FairModel, FairMetaModel)):
                 # Check if calculated
                 if proported_model.calculation_completed():
                     rv[proported_model.get_name()] = proported_model
@@ -113,9 +121,9 @@ class FairBaseReport(object):
         To avoid having separate image files, pyfair simply embeds report
         images as base64 image tags. base64ify() is a convenience function
         that creates these tags.
-        image : [bytes, str, pathlib.Path]
-            The binary data, path string, or pathlib.Path containing either
-            the data itself or a file of data.
+        image : [bytes, str, pathlib.Path, io.BytesIO]
+            The binary data, path string, pathlib.Path, or in-memory buffer
+            containing either the data itself or a file of data.
         
         alternative_text: str, optional
             Alternative text to be showed in the event the image does not
@@ -133,18 +141,18 @@ class FairBaseReport(object):
             If the image parameter supplied is of an inappropriate type
         """
         # If path, open and read.
-        if type(image) == str or isinstance(image, pathlib.Path):
-            with open(image, 'rb') as f:
-                binary_data = f.read()
+        if isinstance(image, (str, pathlib.Path)):
+            binary_data = pathlib.Path(image).read_bytes()
         # If bytes, jsut write
-        elif type(image) == bytes:
+        elif isinstance(image, (bytes, bytearray, memoryview)):
             binary_data = image
+        # If buffer, encode its contents without copying them out
+        elif isinstance(image, io.BytesIO):
+            binary_data = image.getbuffer()
         else:
-            raise TypeError(str(image) + ' is not a string, path, or bytes.')
-        # Get base64 string
-        base64_string = base64.b64encode(binary_data).decode('utf8')
-        # Create tag
-        tag = f'<img {options} src="data:image/png;base64, {base64_string}" alt="{alternative_text}"/>'
+            raise TypeError(str(image) + ' is not a string, path, bytes, or buffer.')
+        # Get base64 string and create tag
+        tag = _base64_img_tag(binary_data, alternative_text, options)
         return tag
 
     def _construct_output(self):
@@ -162,26 +170,56 @@ class FairBaseReport(object):
             The output path to which the HTML data is written
         """
         output = self._construct_output()
-        with open(output_path, 'w+') as f:
+        # Reports carry inline images, so write through a 1 MiB buffer
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
             f.write(output)
 
     def _fig_to_img_tag(self, fig):
         """Converts matplotlib fig to base64 encoded img tag"""
         data = io.BytesIO()
         fig.savefig(data, format='png', transparent=True)
-        data.seek(0)
-        img_tag = self.base64ify(data.read())
+        img_tag = self.base64ify(data)
+        # Release the figure from pyplot's registry once it is encoded
+        plt.close(fig)
         return img_tag
 
+    def _rows_to_html(self, rows, classes, columns=None):
+        """Write (label, cells) pairs as an HTML table like to_html()
+
+        pandas renders tables cell by cell through its formatting
+        machinery, which is slow for wide results. This emits the same
+        markup directly from already formatted strings.
+
+        """
+        lines = [f'<table class="dataframe {classes}">']
+        # Header row only where columns are supplied
+        if columns is not None:
+            lines.append('  <thead>\n    <tr style="text-align: left;">\n      <th></th>')
+            lines.extend([f'      <th>{html.escape(str(column))}</th>' for column in columns])
+            lines.append('    </tr>\n  </thead>')
+        lines.append('  <tbody>')
+        for label, cells in rows:
+            lines.append(f'    <tr>\n      <th>{html.escape(str(label))}</th>')
+            lines.extend([f'      <td>{html.escape(cell)}</td>' for cell in cells])
+            lines.append('    </tr>')
+        lines.append('  </tbody>\n</table>')
+        return '\n'.join(lines)
+
     def _get_data_table(self, model):
         """Takes model and gnerates HTML table from the model's results"""
         data = model.export_results().dropna(axis=1)
-        table = data.to_html(
-            border=0, 
-            justify='left', 
-            classes='fair_metadata_table'
+        # Look up one formatter per column rather than per cell
+        formatters = [
+            self._format_strings.get(column, '{}').format
+            for column
+            in data.columns
+        ]
+        rows = (
+            (label, [fmt(item) for fmt, item in zip(formatters, values)])
+            for label, values
+            in zip(data.index, data.values.tolist())
         )
-        return table
+        return self._rows_to_html(rows, 'fair_metadata_table', data.columns)
 
     def _get_parameter_table(self, model):
         """Visitorish function to inspect a model's parameters"""
@@ -190,8 +228,11 @@ class FairBaseReport(object):
 
     def _get_metadata_table(self):
         """Generate table of metadata to attach to top of model.
-        Do not put model-specific data in here.
+        Do not put model-specific data in here. The table is rendered once
+        per report instance and reused on subsequent calls.
         """
+        if self._metadata_table is not None:
+            return self._metadata_table
         # Get username
         try:
             username = getpass.getuser()
@@ -199,13 +240,15 @@ class FairBaseReport(object):
         except Exception:
             username = 'Unknown'
         # Add metadata
-        metadata = pd.Series({
+        metadata = {
             'Author': username,
-            'Created': str(datetime.datetime.now()).partition('.')[0],
+            'Created': datetime.datetime.now().isoformat(sep=' ', timespec='seconds'),
             'PyFair Version': VERSION,
             'Type': type(self).__name__
-        }).to_frame().to_html(border=0, header=None, justify='left', classes='fair_metadata_table')
-        return metadata
+        }
+        rows = [(key, [value]) for key, value in metadata.items()]
+        self._metadata_table = self._rows_to_html(rows, 'fair_metadata_table')
+        return self._metadata_table
 
     def _get_tree(self, model):
         """Create base64 image string using FairTreeGraph"""
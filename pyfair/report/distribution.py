@@ -105,30 +105,28 @@ class FairDistributionCurve(FairBaseCurve):
         ax.set_ylabel('Frequency Histogram')
         for tick in ax.axes.xaxis.get_major_ticks():
             tick.label1.set_horizontalalignment('left')
-        # Draw histrogram for each model
-        legend_labels = []
-        for name, model in self._input.items():
-            legend_labels.append(name)
-            plt.hist(
-                [model.export_results()['Risk']], 
-                bins=25,
-                alpha=.3
-            )
-        ax.legend(legend_labels, frameon=False)
-        # Min and Max post graphing
-        xmin, xmax = ax.get_xlim()
+        # Compute bin edges and PDF space once for all models
+        risks = {
+            name: model.export_results()['Risk'].values
+            for name, model
+            in self._input.items()
+        }
+        edges = np.histogram_bin_edges(np.concatenate(list(risks.values())), bins=25)
+        space = np.linspace(0, edges[-1], 1000)
         # Now draw twin axis a d style
         tyax = plt.twinx(ax)
         tyax.set_ylabel('PDF')
         tyax.set_yticks([])
-        # Plot for each
-        for name, model in self._input.items():
-            risk = model.export_results()['Risk']
+        # Draw histrogram and PDF for each model in a single pass
+        legend_labels = []
+        for name, risk in risks.items():
+            legend_labels.append(name)
+            ax.hist(risk, bins=edges, alpha=.3)
             # Catch warnings as we're "fitting" with known shape parameters.
             with warnings.catch_warnings():
                 warnings.simplefilter("ignore")
                 beta_curve = beta(*beta.fit(risk))
-            space = np.linspace(0, xmax, 1000)
             tyax.plot(space, beta_curve.pdf(space))
+        ax.legend(legend_labels, frameon=False)
         plt.margins(0)
         return (fig, ax)
\ No newline at end of file
@@ -3,8 +3,6 @@
 import matplotlib
 import matplotlib.pyplot as plt
 import numpy as np
-import pandas as pd
-import scipy.stats as stats
 
 from matplotlib.ticker import StrMethodFormatter
 
@@ -34,14 +32,14 @@ class FairExceedenceCurves(FairBaseCurve):
         for name, model in self._input.items():
             legend_labels.append(name)
             data = model.export_results()
-            # Get Risk Data
-            risk = data['Risk']
-            risk_max = risk.max()
+            # Get Risk Data sorted once for both curves
+            sorted_risk = np.sort(data['Risk'].values)
+            risk_max = sorted_risk[-1]
             # Create feature space
-            space = pd.Series(np.linspace(0, risk_max, 100))
+            space = np.linspace(0, risk_max, 100)
             # Get X and Y for each calculation
-            prob_xy = self._get_prob_data(space, risk)
-            loss_xy = self._get_loss_data(space, risk)
+            prob_xy = self._get_prob_data(space, sorted_risk)
+            loss_xy = self._get_loss_data(space, sorted_risk)
             # Generate curves with x and y
             self._generate_prob_curve(name, ax1, *prob_xy)
             self._generate_loss_curve(name, ax2, *loss_xy)
@@ -49,15 +47,32 @@ class FairExceedenceCurves(FairBaseCurve):
         ax2.legend(legend_labels, frameon=False)
         return (fig, (ax1, ax2))
 
-    def _get_prob_data(self, space, risk):
-        """Get the percentle score for each risk value"""
-        quantiles = space.map(lambda x: stats.percentileofscore(risk, x))
+    def _get_prob_data(self, space, sorted_risk):
+        """Get the percentle score for each risk value
+
+        Equivalent to scipy.stats.percentileofscore(kind='rank') for each
+        value in space, but requires risk to be sorted in advance.
+
+        """
+        space = np.asarray(space)
+        sorted_risk = np.asarray(sorted_risk)
+        left = np.searchsorted(sorted_risk, space, side='left')
+        right = np.searchsorted(sorted_risk, space, side='right')
+        quantiles = (left + right + (right > left)) * (50.0 / len(sorted_risk))
         return (quantiles, space)
 
-    def _get_loss_data(self, space, risk):
-        """Get percentage of values under loss value for each value"""
-        loss_ex = space.map(lambda value: (value < risk).mean())
-        return (space, loss_ex * 100)    
+    def _get_loss_data(self, space, sorted_risk):
+        """Get percentage of values under loss value for each value
+
+        Requires risk to be sorted in advance.
+
+        """
+        space = np.asarray(space)
+        sorted_risk = np.asarray(sorted_risk)
+        # Count of risk values strictly greater than each space value
+        exceeding = len(sorted_risk) - np.searchsorted(sorted_risk, space, side='right')
+        loss_ex = exceeding / len(sorted_risk)
+        return (space, loss_ex * 100)
 
     def _generate_prob_curve(self, name, ax, quantiles, space):
         """For each percentile, what is the expected loss?"""
@@ -1,8 +1,12 @@
 """Simple report for demonstrating aggregate risk"""
 
+import re
+
 import pandas as pd
 
 from .base_report import FairBaseReport
+from ..model.model import FairModel
+from ..model.meta_model import FairMetaModel
 
 
 class FairSimpleReport(FairBaseReport):
@@ -25,12 +29,15 @@ class FairSimpleReport(FairBaseReport):
     >>> fsr.generate_html('output.html')
 
     """
+    # Template placeholders take the form {UPPER_CASE_NAME}
+    _PLACEHOLDER = re.compile(r'\{([A-Z_]+)\}')
+
     def __init__(self, model_or_models, currency_prefix='$'):
         super().__init__(currency_prefix=currency_prefix)
         self._currency_prefix = currency_prefix
         self._model_or_models = self._input_check(model_or_models)
-        self._css = self._template_paths['css'].read_text()
-        self._template = self._template_paths['simple'].read_text()
+        self._css = self._STATIC_CSS
+        self._template = self._STATIC_TEMPLATES['simple']
 
     def _construct_output(self):
         """HTML creation function called by FairBaseReport.to_html()
@@ -39,56 +46,55 @@ class FairSimpleReport(FairBaseReport):
         type.
 
         """
-        # Alias
-        t = self._template
-        # Add css
-        t = t.replace('{STYLE}', self._css)
-        # Add Metadata
-        t = t.replace('{METADATA}', self._get_metadata_table())
-        # Get logo tag
-        b64 = self.base64ify(self._logo_location)
-        t = t.replace('{PYTHON_LOGO}', b64)
+        # Collect the content for each {PLACEHOLDER} in the template
+        sections = {
+            'STYLE': self._css,
+            'METADATA': self._get_metadata_table(),
+            'PYTHON_LOGO': self._LOGO_TAG,
+        }
 
         # Overview Table
-        overview_html = self._get_overview_table(self._model_or_models)
-        t = t.replace('{OVERVIEW_DATAFRAME}', overview_html)
+        sections['OVERVIEW_DATAFRAME'] = self._get_overview_table(self._model_or_models)
 
         # Overview Hist
-        hist = self._get_distribution(
+        sections['HIST'] = self._get_distribution(
             self._model_or_models.values(), 
             currency_prefix=self._currency_prefix
         )
-        t = t.replace('{HIST}', hist)
 
         # Overview Exceedence Curves
-        exceed = self._get_exceedence_curves(
+        sections['EXCEEDENCE'] = self._get_exceedence_curves(
             self._model_or_models.values(), 
             currency_prefix=self._currency_prefix
         )
-        t = t.replace('{EXCEEDENCE}', exceed)
 
         # Create parameter html
-        parameter_html = ''
+        parameter_parts = []
         for name, model in self._model_or_models.items():
-            parameter_html += "<h1>{}</h1>".format(name)
+            parameter_parts.append("<h1>{}</h1>".format(name))
 
             # Create images which differ based on type
-            if model.__class__.__name__ == 'FairModel':
-                parameter_html += self._get_tree(model)
-            if model.__class__.__name__ == 'FairMetaModel':
-                parameter_html += self._get_violins(model)
+            if isinstance(model, FairModel):
+                parameter_parts.append(self._get_tree(model))
+            if isinstance(model, FairMetaModel):
+                parameter_parts.append(self._get_violins(model))
                 
             # Create table
 
             # Create tables which differ based on type
-            if model.__class__.__name__ == 'FairModel':
-                parameter_html += self._get_model_parameter_table(model)
-            if model.__class__.__name__ == 'FairMetaModel':
-                parameter_html += self._get_metamodel_parameter_table(model)
+            if isinstance(model, FairModel):
+                parameter_parts.append(self._get_model_parameter_table(model))
+            if isinstance(model, FairMetaModel):
+                parameter_parts.append(self._get_metamodel_parameter_table(model))
 
-            parameter_html += "<br>"
+            parameter_parts.append("<br>")
 
         # TODO Text wrap
-        t = t.replace('{PARAMETER_HTML}', parameter_html)
+        sections['PARAMETER_HTML'] = ''.join(parameter_parts)
 
+        # Fill every placeholder in a single pass over the template
+        t = self._PLACEHOLDER.sub(
+            lambda match: sections[match.group(1)],
+            self._template
+        )
         return t
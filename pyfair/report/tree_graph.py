@@ -1,13 +1,19 @@
 """Module for generating a tree graph"""
 
-import pandas as pd
+from collections import namedtuple
+
+import numpy as np
 
 import matplotlib.pyplot as plt
 from matplotlib.patches import Patch
 from matplotlib.patches import Rectangle
+from matplotlib.collections import LineCollection
 from matplotlib.collections import PatchCollection
 
 
+# Position of a node's box and of the box it feeds into
+_Dimensions = namedtuple('_Dimensions', ['tag', 'self_x', 'self_y', 'parent_x', 'parent_y'])
+
 class FairTreeGraph(object):
     """Provides a pretty tree diagram to summarize calculations.
 
@@ -25,8 +31,10 @@ class FairTreeGraph(object):
 
     """
     # Class attribute with magic numbers galore
-    _DIMENSIONS = pd.DataFrame.from_dict(
-        {
+    _DIMENSIONS = {
+        name: _Dimensions(*dimensions)
+        for name, dimensions
+        in {
             'Contact Frequency'             : ['C'   ,    0,    0,  600,  800],
             'Threat Event Frequency'        : ['TEF' ,  600,  800, 1800, 1600],
             'Probability of Action'         : ['A'   , 1200,    0,  600,  800],
@@ -40,41 +48,55 @@ class FairTreeGraph(object):
             'Secondary Loss'                : ['SL'  , 7800,  800, 6600, 1600],
             'Secondary Loss Event Frequency': ['SLEF', 7200,    0, 7800,  800],
             'Secondary Loss Event Magnitude': ['SLEM', 8400,    0, 7800,  800],
-        }, 
-        orient='index', 
-        columns=['tag', 'self_x', 'self_y', 'parent_x', 'parent_y']
-    )
+        }.items()
+    }
+    _HEADER_STYLE = {'horizontalalignment': 'center', 'fontsize': 14, 'fontweight': 'bold'}
+    _BODY_STYLE = {'horizontalalignment': 'left', 'fontsize': 8, 'fontfamily': 'monospace'}
+    _CURVE_STEPS = np.linspace(0, 1, 25)
 
     def __init__(self, model, format_strings):
         self._colormap = {'Not Required': 'grey', 'Supplied': 'green', 'Calculated': 'blue'}
-        self._results = model.export_results().T
         self._format_strings = format_strings
-        # Calculate mean and standard deviation for results
-        self._result_summary = pd.DataFrame({
-            'μ': self._results.mean(axis=1), 
-            'σ': self._results.std(axis=1),
-            '↑': self._results.max(axis=1),
-        })
-        # Make status input into a dataframe.
+        # Calculate mean, standard deviation, and max for results in NumPy
+        results = model.export_results()
+        values = results.to_numpy(dtype=float)
+        self._result_summary = {
+            name: {'μ': mean, 'σ': stdev, '↑': maximum}
+            for name, mean, stdev, maximum
+            in zip(
+                results.columns,
+                values.mean(axis=0),
+                values.std(axis=0, ddof=1),
+                values.max(axis=0),
+            )
+        }
+        # Make status input into a dict of records.
         self._statuses = model.get_node_statuses()
         self._process_statuses()
-        # Make params a frame (must occur after process_statuses())
-        self._params = pd.DataFrame(model.export_params()).T.reindex(self._statuses.index)
-        # Tack all data together
-        self._data = pd.concat([
-            self._statuses,
-            self._DIMENSIONS,
-            self._result_summary,
-            self._params
-        ], axis=1, sort=True)
-        # Add format strinsg (forgot to add previously)
-        self._data['formatter'] = pd.Series(self._format_strings)
+        self._params = model.export_params()
+        # Tack all data together as one record per node
+        self._data = [
+            {
+                'name': name,
+                **status,
+                **self._DIMENSIONS[name]._asdict(),
+                **self._result_summary[name],
+                **self._params.get(name, {}),
+                'formatter': self._format_strings.get(name),
+            }
+            for name, status
+            in sorted(self._statuses.items())
+        ]
+        # Text only depends on the data, so format it once up front
+        self._text = self._prepare_text()
 
     def _process_statuses(self):
-        """Turn dict into df and add color column"""
-        self._statuses = pd.DataFrame.from_records([self._statuses]).T
-        self._statuses.columns = ['status']
-        self._statuses['color'] = self._statuses['status'].map(self._colormap)
+        """Turn status dict into records and add color"""
+        self._statuses = {
+            name: {'status': status, 'color': self._colormap.get(status)}
+            for name, status
+            in self._statuses.items()
+        }
 
     def _tweak_axes(self, ax):
         """Add title and run common changes"""
@@ -93,7 +115,7 @@ class FairTreeGraph(object):
         """Generate rectangles, which cannot be done via apply"""
         patches = []
         patch_colors = []
-        for index, row in self._data.iterrows():
+        for row in self._data:
             rect = Rectangle(
                 (row['self_x'], row['self_y']),
                 1000,
@@ -106,93 +128,78 @@ class FairTreeGraph(object):
         ax.add_collection(collection)
         return ax
 
-    def _generate_text(self, row, ax):
-        """Apply-able function to gnereate text in rectangles"""
-        # Draw header
-        plt.text(
-            row['self_x'] + 500, 
-            row['self_y'] + 370, 
-            row['tag'], 
-            horizontalalignment='center',
-            fontsize=14,
-            fontweight='bold',
-        )
-        # Draw data
+    def _format_text(self, row):
+        """Format the summary text for a single node record"""
+        # Not required nodes get a header and box but no body text
+        if row['status'] not in ('Calculated', 'Supplied'):
+            return ''
         fmt = row['formatter']
-        # Set conditions
-        calculated = row['status'] == 'Calculated'
-        supplied = row['status'] == 'Supplied'
         # Raw inputs will have a list
-        if 'raw' in row.index:
-            if isinstance(row['raw'], list):
-                raw = True
-            else:
-                raw = False
+        if row['status'] == 'Supplied' and isinstance(row.get('raw'), list):
+            return 'Raw input'
+        if row['status'] == 'Calculated':
+            # Get rid of items without value
+            data = {
+                key: fmt.format(row[key])
+                for key
+                in ['μ', 'σ', '↑']
+                if not np.isnan(row[key])
+            }
         else:
-            raw = False
-        if calculated:
-            # Get rid of items with value
-            data = row.loc[['μ', 'σ', '↑']].dropna()
-            # Get max legnth for justification
-            data = data.map(lambda x: fmt.format(x))
-            value_just = data.str.len().max()
-            # Create output
-            output = '\n'.join([
-                key + '  ' + value.rjust(value_just)
-                for key, value
-                in data.items()
-            ])
-        elif supplied:
             # Get rid of value less items and rename
-            data = row.reindex(['high', 'mode', 'low', 'mean', 'stdev'])
-            data.index = ['↑', '-', '↓', 'μ', 'σ']
-            data = data.dropna()
-            # Format string
-            data = data.map(lambda x: fmt.format(x))
-            # Get max length of stirng
-            value_just = data.str.len().max()
-            # Output format for raw
-            if raw:
-                output = '\n'.join([
-                    key + '  ' + value.rjust(value_just)
-                    for key, value
-                    in data.items()
-                ])
-                output = 'Raw input'
-            # And verything else ... so much nesting
-            else:
-                output = '\n'.join([
-                    key + '  ' + value.rjust(value_just)
-                    for key, value
-                    in data.items()
-                ])
-        else:
-            output = ''
-        plt.text(
-            row['self_x'] + 25, 
-            row['self_y'] + 50, 
-            output,
-            horizontalalignment='left',
-            fontsize=8,
-            fontfamily='monospace'
+            data = {
+                label: fmt.format(row[key])
+                for key, label
+                in [('high', '↑'), ('mode', '-'), ('low', '↓'), ('mean', 'μ'), ('stdev', 'σ')]
+                if key in row
+            }
+        # Get max length for justification
+        value_just = max([len(value) for value in data.values()], default=0)
+        return '\n'.join([
+            key + '  ' + value.rjust(value_just)
+            for key, value
+            in data.items()
+        ])
+
+    def _prepare_text(self):
+        """Precompute position, content, and style for all node text"""
+        text = []
+        for row in self._data:
+            # Header followed by data
+            text.append((row['self_x'] + 500, row['self_y'] + 370, row['tag'], self._HEADER_STYLE))
+            text.append((row['self_x'] + 25, row['self_y'] + 50, self._format_text(row), self._BODY_STYLE))
+        return text
+
+    def _generate_text(self, ax):
+        """Draw the precomputed text in rectangles"""
+        for x, y, content, style in self._text:
+            ax.text(x, y, content, **style)
+
+    def _generate_lines(self, ax):
+        """Generate lines between boxes as a single collection"""
+        segments = []
+        colors = []
+        for row in self._data:
+            if (row['color'] != 'grey') and row['name'] != 'Risk':
+                # Same curve as connectionstyle "angle3,angleA=0,angleB=-90":
+                # a quadratic Bezier leaving the child horizontally and
+                # arriving at the parent vertically.
+                start = np.array([row['self_x'] + 500, row['self_y'] + 500])
+                end = np.array([row['parent_x'] + 500, row['parent_y']])
+                control = np.array([end[0], start[1]])
+                t = self._CURVE_STEPS[:, np.newaxis]
+                segments.append(
+                    (1 - t) ** 2 * start + 2 * (1 - t) * t * control + t ** 2 * end
+                )
+                colors.append(row['color'])
+        collection = LineCollection(
+            segments,
+            colors=colors,
+            alpha=.3,
+            linestyles='--',
+            linewidths=3,
         )
-
-    def _generate_lines(self, row, ax):
-        """Generate lines between boxes"""
-        if (row['color'] != 'grey') and row.name != 'Risk':
-            ax.annotate(
-                None,
-                xy=(row['parent_x'] + 500, row['parent_y']), 
-                xytext=(row['self_x'] + 500, row['self_y'] + 500),     
-                arrowprops=dict(
-                    arrowstyle="-",
-                    connectionstyle="angle3,angleA=0,angleB=-90",
-                    ec=row['color'],
-                    alpha=.3,
-                    linestyle='--', 
-                    linewidth=3
-                ),
-            )
+        ax.add_collection(collection)
 
     def _generate_legend(self, ax):
         """Simply function to generate legend"""
@@ -218,8 +225,8 @@ class FairTreeGraph(object):
         fig, ax = plt.subplots()
         fig.set_size_inches(20, 6)
         ax = self._tweak_axes(ax)
-        self._data.apply(self._generate_text, args=[ax], axis=1)
+        self._generate_text(ax)
         self._generate_rects(ax)
-        self._data.apply(self._generate_lines, args=[ax], axis=1)
+        self._generate_lines(ax)
         self._generate_legend(ax)
         return (fig, ax)
\ No newline at end of file
@@ -3,6 +3,7 @@
 import matplotlib
 import matplotlib.pyplot as plt
 
+from ..model.meta_model import FairMetaModel
 from ..utility.fair_exception import FairException
 from .base_curve import FairBaseCurve
 
@@ -16,10 +17,13 @@ class FairViolinPlot(FairBaseCurve):
         The metamodel being analyzed
 
     """
+    # Upper bound on rows fed to violinplot's kernel density estimates
+    _MAX_KDE_SAMPLES = 50_000
+
     def __init__(self, metamodel):
         # If it's just a model, make it a list.
         super().__init__()
-        if not metamodel.__class__.__name__ == 'FairMetaModel':
+        if not isinstance(metamodel, FairMetaModel):
             raise FairException('This requires a metamodel')
         self._metamodel = metamodel
 
@@ -35,9 +39,14 @@ class FairViolinPlot(FairBaseCurve):
         # Setup plots
         fig, ax = plt.subplots(figsize=(16, 8))
         # For each model, calculate and plot.
-        columns = self._metamodel.export_results().columns
+        results = self._metamodel.export_results()
+        columns = results.columns
+        values = results.values
+        # The KDE converges well below full simulation counts, so thin out
+        # very large runs with a stride rather than estimating on all rows.
+        stride = max(1, len(values) // self._MAX_KDE_SAMPLES)
         ax.violinplot(
-            self._metamodel.export_results().values,
+            values[::stride],
             showmeans=False,
             showmedians=True
         )
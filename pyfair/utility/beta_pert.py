@@ -1,12 +1,33 @@
 """Module defining a BetaPERT distribution"""
 
+import functools
+
 import scipy.stats
 import numpy as np
-import pandas as pd
 
 from .fair_exception import FairException
 
 
+def _pert_parameters(low, mode, high, gamma):
+    """Generate alpha and beta for a BetaPERT distribution
+
+    See FairBetaPert for the derivation. Substituting the mean and stdev
+    into the alpha and beta formulas leaves, with u = 1 + gamma * (mode -
+    low) / range and v = 1 + gamma * (high - mode) / range:
+
+        alpha = u * (u * v - 1) / (gamma + 2)
+        beta  = v * (u * v - 1) / (gamma + 2)
+
+    This works elementwise on arrays as well as on scalars.
+
+    """
+    value_range = high - low
+    u = 1 + gamma * (mode - low) / value_range
+    v = 1 + gamma * (high - mode) / value_range
+    scale = (u * v - 1) / (gamma + 2)
+    return u * scale, v * scale
+
+
 class FairBetaPert(object):
     r"""A PERT distribution for all your pseudoscientific needs.
 
@@ -16,8 +37,8 @@ class FairBetaPert(object):
     possible to precompute the appropriate BetaPert parameters, and then
     simply create a Beta distribution using those parameters.
 
-    This curve is generated upon instantiation, and random variates are
-    then generated by the random_variates() function.
+    The curve parameters are generated upon instantiation, and random
+    variates are then generated by the random_variates() function.
 
     Parameters
     ----------
@@ -29,6 +50,9 @@ class FairBetaPert(object):
         Higher bound for the distribution above which no values will fall
     gamma : float or int, optional
         A BetaPERT parameter for narrowing peak, default is 4
+    rng : numpy.random.Generator or numpy.random.RandomState, optional
+        The default source of randomness for random_variates(), default
+        is the global NumPy state (which is what FairModel seeds)
 
     Notes
     -----
@@ -117,22 +141,24 @@ class FairBetaPert(object):
               attribute.
 
     """
-    def __init__(self, low, mode, high, gamma=4):
+    def __init__(self, low, mode, high, gamma=4, rng=None):
         # Populate object with inputs
         self._low   = low
         self._mode  = mode
         self._high  = high
         self._gamma = gamma
+        self._rng   = rng
         self._range = high - low
         # Run sanity check
         self._run_range_check()
-        # Run mean, alpha, and beta calcs in sequence.
-        self._mean  = self._generate_mean()
-        self._stdev = self._generate_stdev()
-        self._alpha = self._generate_alpha()
-        self._beta  = self._generate_beta()
-        # Generate curve
-        self._beta_curve = scipy.stats.beta(
+        # Run alpha and beta calcs in a single call.
+        self._mean = (low + gamma * mode + high) / (gamma + 2)
+        self._alpha, self._beta = _pert_parameters(low, mode, high, gamma)
+
+    @functools.cached_property
+    def _beta_curve(self):
+        """The equivalent scipy beta distribution, built on first access"""
+        return scipy.stats.beta(
             self._alpha, 
             self._beta, 
             self._low,
@@ -151,52 +177,85 @@ class FairBetaPert(object):
         if self._range <= 0:
             raise FairException('"low" value must be less than "high" value.')
 
-    def _generate_mean(self):
-        """Generate mean for beta distribution"""
-        return (
-            (self._low + self._gamma * self._mode + self._high)
-            /
-            (self._gamma + 2)
-        )
+    def random_variates(self, count, rng=None):
+        """Get n PERT-distributed random numbers
 
-    def _generate_stdev(self):
-        """Generate standard deviation"""
-        return (
-            (self._high - self._low)
-            /
-            (self._gamma + 2)
-        )
+        This draws from NumPy's beta sampler directly and scales the result
+        onto [low, high]. It is the same draw that the rvs() function of the
+        beta curve stored at self._beta_curve makes, without passing through
+        scipy's argument checking and broadcasting on every call.
 
-    def _generate_alpha(self):
-        """Generate alpha parameter for beta distrubtions"""
-        group_1 = (self._mean - self._low) / (self._high - self._low)
-        group_2 = ((self._mean - self._low) * (self._high - self._mean)
-                  / 
-                  (self._stdev ** 2)
-        )
-        return group_1 * (group_2 - 1)
+        Parameters
+        ----------
+        count : int
+            The number of random variates that are required to be created
+        rng : numpy.random.Generator or numpy.random.RandomState, optional
+            The source of randomness, default is the one supplied at
+            construction, or else the global NumPy state
 
-    def _generate_beta(self):
-        """Generate beta parameter for beta distribution"""
-        beta_numerator = self._alpha * (self._high - self._mean)
-        beta_denominator = self._mean - self._low
-        return beta_numerator / beta_denominator
+        Returns
+        -------
+        np.array
+            An array of PERT-distributed random variates of size `count`
 
-    def random_variates(self, count):
-        """Get n PERT-distributed random numbers
+        """
+        if rng is None:
+            rng = self._rng if self._rng is not None else np.random
+        variates = rng.beta(self._alpha, self._beta, count)
+        return variates * self._range + self._low
 
-        This works by simpling calling the rvs() function of the beta curve
-        that is stored at self._beta_curve.
+    @staticmethod
+    def sample_batch(lows, modes, highs, count, gammas=4, rng=None):
+        """Get n PERT-distributed random numbers for many distributions
+
+        The parameters are computed elementwise for every distribution and
+        all of the variates are drawn in a single array-shaped call to
+        NumPy's beta sampler rather than building one FairBetaPert per
+        distribution. Rows are drawn in order, so the result is identical
+        to calling random_variates() on each distribution in turn.
 
         Parameters
         ----------
+        lows : array-like of float or int
+            Lower bounds for each distribution
+        modes : array-like of float or int
+            Most common values for each distribution
+        highs : array-like of float or int
+            Higher bounds for each distribution
         count : int
-            The number of random variates that are required to be created
+            The number of random variates required for each distribution
+        gammas : float, int, or array-like, optional
+            BetaPERT parameters for narrowing peaks, default is 4
+        rng : numpy.random.Generator or numpy.random.RandomState, optional
+            The source of randomness, default is the global NumPy state
 
         Returns
         -------
         np.array
-            An array of PERT-distributed random variates of size `count`
+            An array of PERT-distributed random variates of shape
+            (number of distributions, `count`)
+
+        Raises
+        ------
+        FairException
+            When any low input is not less than its high
 
         """
-        return self._beta_curve.rvs(count)
+        lows, modes, highs, gammas = np.broadcast_arrays(*[
+            np.atleast_1d(np.asarray(item, dtype=float))
+            for item
+            in [lows, modes, highs, gammas]
+        ])
+        ranges = highs - lows
+        if (ranges <= 0).any():
+            raise FairException('"low" value must be less than "high" value.')
+        alphas, betas = _pert_parameters(lows, modes, highs, gammas)
+        if rng is None:
+            rng = np.random
+        # One column vector per parameter broadcasts across the count axis
+        variates = rng.beta(
+            alphas[:, np.newaxis],
+            betas[:, np.newaxis],
+            size=(len(lows), count),
+        )
+        return variates * ranges[:, np.newaxis] + lows[:, np.newaxis]
@@ -1,9 +1,12 @@
 """This module contains a database class for storing models."""
 
+import contextlib
+import copy
 import json
 import pathlib
+import re
 import sqlite3
-import uuid
+import zlib
 
 import pandas as pd
 
@@ -33,29 +36,96 @@ class FairDatabase(object):
     >>> db2 = FairDatabase('/not/existing/database.sqlite3')
     >>> db2.store(model)
     >>> query_output_string = db2.query('SELECT uuid, json FROM model')
+    >>> db2.close()
+    >>> with FairDatabase('/existing/database.sqlite3') as db3:
+    ...     db3.store_many(models)
 
     """
+    # Models store their UUIDs as str(uuid.uuid1()), i.e. 8-4-4-4-12 hex
+    _UUID_PATTERN = re.compile(
+        r'[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z'
+    )
+
+    # Model JSON larger than this (typically raw inputs) is stored as a
+    # zlib-compressed BLOB; smaller JSON stays as queryable text
+    _COMPRESSION_THRESHOLD = 64 * 1024
+
+    # Maximum number of calculated models kept for repeated loads
+    _MODEL_CACHE_SIZE = 32
+
+    # SQL used on every load/store. sqlite3 caches prepared statements per
+    # connection keyed by text, so these are compiled once per connection.
+    _SELECT_UUID_BY_NAME_SQL = "SELECT uuid FROM models WHERE name = ?"
+    _SELECT_MODEL_SQL = "SELECT * FROM models WHERE uuid = ?"
+    _INSERT_MODEL_SQL = "INSERT OR REPLACE INTO models VALUES(?, ?, ?, ?)"
+    _INSERT_RESULTS_SQL = "INSERT OR REPLACE INTO results VALUES(?, ?, ?, ?, ?)"
+
     def __init__(self, path):
         self._path = pathlib.Path(path)
+        # One connection is reused for every call until close()
+        self._conn = None
+        # Calculated models by UUID, valid while the database is unchanged
+        self._model_cache = {}
+        self._cache_version = None
         self._initialize()
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the underlying connection
+
+        The connection is reopened automatically if the database is used
+        again after being closed.
+
+        """
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        # Versions are only comparable within a single connection
+        self._model_cache = {}
+        self._cache_version = None
+
+    @contextlib.contextmanager
+    def _connect(self):
+        """Use the persistent connection and commit when done"""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self._path, check_same_thread=False)
+            # WAL only needs a sync at checkpoints, so NORMAL is still safe
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA temp_store=MEMORY")
+        with self._conn:
+            yield self._conn
+
     def _initialize(self):
         """Initialize database with tables if necessary."""
-        with sqlite3.connect(self._path) as conn:
+        with self._connect() as conn:
+            # Journal mode is persistent, so it only needs setting once
+            conn.execute("PRAGMA journal_mode=WAL")
+            # "string" is not a SQLite type and gets NUMERIC affinity, which
+            # turns names like "0123" into integers, so use TEXT throughout
             conn.execute("""CREATE TABLE IF NOT EXISTS models (
-                uuid string,
-                name string,
-                creation_date text NOT NULL,
-                json string NOT NULL,
+                uuid TEXT NOT NULL,
+                name TEXT,
+                creation_date TEXT NOT NULL,
+                json TEXT NOT NULL,
                 CONSTRAINT model_pk PRIMARY KEY (uuid));
             """)
+            # Narrow rows keyed by uuid are stored directly in the PK B-tree
             conn.execute("""CREATE TABLE IF NOT EXISTS results (
-                uuid string,
-                mean real NOT NULL,
-                stdev real NOT NULL,
-                min real NOT NULL,
-                max real NOT NULL,
-                CONSTRAINT results_pk PRIMARY KEY (uuid));
+                uuid TEXT NOT NULL,
+                mean REAL NOT NULL,
+                stdev REAL NOT NULL,
+                min REAL NOT NULL,
+                max REAL NOT NULL,
+                CONSTRAINT results_pk PRIMARY KEY (uuid)) WITHOUT ROWID;
+            """)
+            # Name lookups would otherwise scan every model (uuid is the PK)
+            conn.execute("""CREATE INDEX IF NOT EXISTS models_name_idx
+                ON models (name);
             """)
 
     def _dict_factory(self, cursor, row):
@@ -69,9 +139,10 @@ class FairDatabase(object):
     def load(self, name_or_uuid):
         """Loads a model from the database
 
-        This takes a name or UUID and looks up the model using a UUID
-        function using self._load_uuid(). If that fails, it attempts to
-        look of the funciton by name using self._load_name().
+        This takes a name or UUID. If the string is shaped like a UUID the
+        model is looked up using self.load_by_uuid(). Otherwise, it looks up
+        the model by name using self.load_by_name(). Callers that already
+        know which they have can call those methods directly.
 
         Parameters
         ----------
@@ -90,52 +161,104 @@ class FairDatabase(object):
             When the UUID or name does not exist in the database
 
         """
-        # If it is a valid UUID
-        try:
-            uuid.UUID(name_or_uuid)
-            model_or_metamodel = self._load_uuid(name_or_uuid)
-        # If not a valid UUID, load by name
-        except ValueError:
-            model_or_metamodel = self._load_name(name_or_uuid)
-        model_or_metamodel.calculate_all()
-        return model_or_metamodel
-
-    def _load_name(self, name):
-        """Load model or metamodel based on first item with that name."""
-        with sqlite3.connect(self._path) as conn:
-            # Create SQlite fow factory
-            conn.row_factory = self._dict_factory
+        # If it is shaped like a stored UUID, load by UUID
+        if self._UUID_PATTERN.match(name_or_uuid):
+            return self.load_by_uuid(name_or_uuid)
+        # If not, load by name
+        else:
+            return self.load_by_name(name_or_uuid)
+
+    def load_by_name(self, name):
+        """Loads the first model with a given name from the database
+
+        Parameters
+        ----------
+        name : str
+            The name of the model or metamodel
+
+        Returns
+        -------
+        FairModel or FairMetaModel
+            The calculated model or metamodel with that name
+
+        Raises
+        ------
+        FairException
+            When the name does not exist in the database
+
+        """
+        with self._connect() as conn:
+            # Create SQlite row factory on the cursor, not the shared conn
             cursor = conn.cursor()
+            cursor.row_factory = self._dict_factory
             # Search for models
-            cursor.execute("SELECT uuid FROM models WHERE name = ?", (name,))
+            cursor.execute(self._SELECT_UUID_BY_NAME_SQL, (name,))
             result = cursor.fetchone()
             if not result:
                 raise FairException('Name for model not found.')
-            # Use model UUID query to load via _load_uuid function
-            model = self._load_uuid(result['uuid'])
+            # Use model UUID query to load via load_by_uuid function
+            model = self.load_by_uuid(result['uuid'])
             return model
 
-    def _load_uuid(self, uuid):
-        """Load model or metamodel based on ID"""
+    def load_by_uuid(self, uuid):
+        """Loads a model from the database by its UUID
+
+        Parameters
+        ----------
+        uuid : str
+            The UUID string of the model or metamodel
+
+        Returns
+        -------
+        FairModel or FairMetaModel
+            The calculated model or metamodel with that UUID
+
+        Raises
+        ------
+        FairException
+            When the UUID does not exist in the database
+
+        """
         # Get models and metamodels
-        with sqlite3.connect(self._path) as conn:
-            conn.row_factory = self._dict_factory
+        with self._connect() as conn:
+            # data_version moves when another connection commits, and
+            # total_changes when this one writes (including via query())
+            version = (
+                conn.execute("PRAGMA data_version").fetchone()[0],
+                conn.total_changes,
+            )
+            if version != self._cache_version:
+                self._model_cache = {}
+                self._cache_version = version
+            # Copies keep callers from mutating the cached model
+            if uuid in self._model_cache:
+                return copy.deepcopy(self._model_cache[uuid])
             cursor = conn.cursor()
+            cursor.row_factory = self._dict_factory
             # Search for models
-            cursor.execute("SELECT * FROM models WHERE uuid = ?", (uuid,))
+            cursor.execute(self._SELECT_MODEL_SQL, (uuid,))
             model_data = cursor.fetchone()
             if not model_data:
                 raise FairException('UUID for model not found.')
             # Load model type based on json
             json_data = model_data['json']
+            # Large models are stored compressed
+            if isinstance(json_data, bytes):
+                json_data = zlib.decompress(json_data).decode('utf-8')
             model_param_data = json.loads(json_data)
             model_type = model_param_data['type']
             if model_type == 'FairMetaModel':
-                model = FairMetaModel.read_json(json_data)
+                model = FairMetaModel.read_json(model_param_data)
             elif model_type == 'FairModel':
-                model = FairModel.read_json(json_data)
+                model = FairModel.read_json(model_param_data)
             else:
                 raise FairException('Unrecognized model type.')
+            # Metamodels are not calculated by read_json()
+            model.calculate_all()
+        # Evict the oldest entry to bound memory
+        if len(self._model_cache) >= self._MODEL_CACHE_SIZE:
+            del self._model_cache[next(iter(self._model_cache))]
+        self._model_cache[uuid] = copy.deepcopy(model)
         return model
 
     def store(self, model_or_metamodel):
@@ -145,7 +268,8 @@ class FairDatabase(object):
         appropriate calculations have been completed, and then stores that
         model. The data is stored in two tables: 1) first the aggregate
         statistics about the risk are stored in the 'results' table, and 2)
-        the model data is stored in the 'models' table.
+        the model data is stored in the 'models' table. Model JSON over
+        64 KiB (usually from raw inputs) is stored zlib-compressed.
 
         Raises
         ------
@@ -153,43 +277,79 @@ class FairDatabase(object):
             If model or metamodel is not yet calculated
 
         """
+        self.store_many([model_or_metamodel])
+
+    def store_many(self, models):
+        """Store several models or metamodels in a single transaction
+
+        Every model is checked and exported before anything is written, so
+        either all of the models are stored or none of them are.
+
+        Parameters
+        ----------
+        models : iterable of FairModel or FairMetaModel
+            The models and metamodels to store
+
+        Raises
+        ------
+        FairException
+            If any model or metamodel is not yet calculated
+
+        Examples
+        --------
+        >>> db = FairDatabase('/existing/database.sqlite3')
+        >>> db.store_many([model_1, model_2, metamodel])
+
+        """
+        model_rows = []
+        result_rows = []
+        for m in models:
+            model_row, result_row = self._export_rows(m)
+            model_rows.append(model_row)
+            result_rows.append(result_row)
+        # Write to database
+        with self._connect() as conn:
+            conn.executemany(self._INSERT_MODEL_SQL, model_rows)
+            conn.executemany(self._INSERT_RESULTS_SQL, result_rows)
+
+    def _export_rows(self, model_or_metamodel):
+        """Create the models and results table rows for a model"""
         m = model_or_metamodel
         # If incomplete and not ready for storage, throw error
         if not m.calculation_completed():
             raise FairException("Model is uncalculated and won't be stored.")
-        # Export from model
-        meta = json.loads(m.to_json())
+        # Export from model (serialized once, identity from accessors)
         json_data = m.to_json()
-        results = m.export_results()['Risk']
-        # Write to database
-        with sqlite3.connect(self._path) as conn:
-            cursor = conn.cursor()
-            # Write model data
-            cursor.execute(
-                """INSERT OR REPLACE INTO models VALUES(?, ?, ?, ?)""",
-                (
-                    meta['model_uuid'], 
-                    meta['name'], 
-                    meta['creation_date'], 
-                    json_data
-                )
-            )
-            # Write cached results
-            cursor.execute(
-                """INSERT OR REPLACE INTO results VALUES(?, ?, ?, ?, ?)""",
-                (
-                    meta['model_uuid'], 
-                    results.mean(axis=0),
-                    results.std(axis=0),
-                    results.min(axis=0),
-                    results.max(axis=0)
-                )
-            )
-        # Vacuum database
-        conn = sqlite3.connect(self._path)
-        conn.execute("VACUUM")
-        conn.commit()
-        conn.close()
+        # Compress large JSON, which is mostly raw input arrays
+        if len(json_data) > self._COMPRESSION_THRESHOLD:
+            json_data = zlib.compress(json_data.encode('utf-8'), 3)
+        # Summarize on the raw array (stdev matches pandas' ddof=1)
+        results = m.export_results()['Risk'].to_numpy(dtype=float)
+        model_row = (
+            m.get_uuid(), 
+            m.get_name(), 
+            m.get_creation_date(), 
+            json_data
+        )
+        result_row = (
+            m.get_uuid(), 
+            float(results.mean()),
+            float(results.std(ddof=1)),
+            float(results.min()),
+            float(results.max())
+        )
+        return model_row, result_row
+
+    def compact(self):
+        """Reclaim unused space in the database file
+
+        Storing a model does not vacuum the database because VACUUM
+        rewrites the entire file. Call this after storing or replacing
+        many models to shrink the file on disk.
+
+        """
+        with self._connect() as conn:
+            conn.execute("VACUUM")
 
     def query(self, query, params=None):
         """Function for querying the underlying database.
@@ -209,7 +369,7 @@ class FairDatabase(object):
             The raw query result from fetchall()
 
         """
-        with sqlite3.connect(self._path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             if params:
                 cursor.execute(query, params)
@@ -1,5 +1,10 @@
 """Model defining a model creator for similar iterations on models"""
 
+import concurrent.futures
+import copy
+
+import numpy as np
+
 from ..model.model import FairModel
 
 
@@ -24,6 +29,25 @@ class FairModelFactory(object):
         self._static_arguments = static_arguments
         self._n_simulations = n_simulations
         self._random_seed = random_seed
+        # Static portion of every model, built on first use
+        self._template = None
+        self._template_random_state = None
+
+    def _get_template(self):
+        """Return a model with only the static arguments applied
+
+        The NumPy random state right after the static draws is kept with
+        the template so that variable arguments are drawn exactly as if
+        the model had been built from scratch. The template is only used
+        when a random seed is set.
+
+        """
+        if self._template is None:
+            template = FairModel('template', self._n_simulations, self._random_seed)
+            self._add_arguments(template, self._static_arguments)
+            self._template = template
+            self._template_random_state = np.random.get_state()
+        return self._template
 
     def generate_from_partial(self, name, variable_arguments):
         """Generate model from name and set of partial parameters
@@ -66,20 +90,29 @@ class FairModelFactory(object):
         ... )
 
         """
-        # Gen model
-        model = FairModel(name, self._n_simulations, self._random_seed)
-        # For each group of arguments, run function.
-        for argument_group in [self._static_arguments, variable_arguments]:
-            self._add_arguments(model, argument_group)
+        if self._random_seed is None:
+            # Unseeded models each need their own static draws
+            model = FairModel(name, self._n_simulations, self._random_seed)
+            self._add_arguments(model, self._static_arguments)
+        else:
+            # Gen model from a copy of the static template with its own identity
+            model = copy.deepcopy(self._get_template())
+            model._reset_identity(name)
+            # Resume the random stream where the static arguments left it
+            np.random.set_state(self._template_random_state)
+        if variable_arguments:
+            self._add_arguments(model, variable_arguments)
         # Calculate all
         model.calculate_all()
         return model
 
-    def generate_from_partials(self, variable_argument_dict):
+    def generate_from_partials(self, variable_argument_dict, max_workers=1):
         """Generate list of models from a list of partial model parameters
 
         This simply takes a list of variable dicts and runs
-        generate_from_partial() on all of them.
+        generate_from_partial() on all of them. Each model is seeded
+        independently, so the models are the same whether they are
+        created one after another or in parallel worker processes.
 
         Parameters
         ----------
@@ -88,6 +121,10 @@ class FairModelFactory(object):
             dictionaries as values. These value dictionaries will have
             target nodes as the keys and dictionaries of arguments for
             those keys as the values
+        max_workers : int or None, optional
+            Number of processes used to create the models. The default of
+            1 creates them in this process, and None uses one process per
+            CPU.
 
         Returns
         -------
@@ -111,25 +148,36 @@ class FairModelFactory(object):
         >>> models = fac.generate_from_partials(param_list)
 
         """
-        # Create a list of models based on variable args
-        model_list = [
-            self.generate_from_partial(name, args)
-            for name, args
-            in variable_argument_dict.items()
-        ]
-        # Calculate
-        for model in model_list:
-            model.calculate_all()
+        # Create a list of models based on variable args. These are
+        # already calculated by generate_from_partial().
+        if max_workers == 1:
+            model_list = [
+                self.generate_from_partial(name, args)
+                for name, args
+                in variable_argument_dict.items()
+            ]
+        else:
+            with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+                model_list = list(executor.map(
+                    self.generate_from_partial,
+                    variable_argument_dict.keys(),
+                    variable_argument_dict.values(),
+                ))
         return model_list
 
     def _add_arguments(self, model, argument_group):
         """Iterate through arguments and input them into the model"""
-        # Go through arguments
+        # Regular arguments are collected so runs of them are input together
+        single_arguments = {}
         for arg_name, arg_value in argument_group.items():
             # If it's multi, run input_multi_data()
             if arg_name.startswith('multi_'):
-                model.input_multi_data(arg_name, **arg_value)
-            # If regular, run input_data()
+                # Input preceding arguments first to keep the draw order
+                model.bulk_import_data(single_arguments)
+                single_arguments = {}
+                model.input_multi_data(arg_name, arg_value)
+            # If regular, queue for bulk_import_data()
             else:
-                model.input_data(arg_name, **arg_value)                
+                single_arguments[arg_name] = arg_value
+        model.bulk_import_data(single_arguments)
         return model
@@ -38,7 +38,6 @@ setup(
         "numpy",
         "scipy",
         "matplotlib",
-        "xlrd",
     ],
     package_dir={"pyfair": "./pyfair"},
     package_data={"pyfair": ["./static/*"]},
@@ -45,12 +45,16 @@ class TestFairMetaModel(unittest.TestCase):
         self.assertRaises(
             FairException, FairMetaModel.read_json, self._MODEL_JSON
         )
+        # Already parsed data is accepted as well
+        meta = FairMetaModel.read_json(json.loads(self._META_MODEL_JSON))
+        self.assertTrue(meta.export_results().equals(self._meta.export_results()))
 
     def test_inspection(self):
         """Check the inspection methods"""
         # Check inspection methods
         self._meta.get_name()
         self._meta.get_uuid()
+        self._meta.get_creation_date()
         # Check dataframe
         self.assertIsInstance(self._meta.export_results(), pd.DataFrame)
         # Check Params
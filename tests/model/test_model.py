@@ -1,8 +1,6 @@
 import json
-import pathlib
 import unittest
 
-import numpy as np
 import pandas as pd
 
 from pyfair.model.model import FairModel
@@ -16,6 +14,20 @@ class TestFairModel(unittest.TestCase):
     MODEL_JSON = '{     "Loss Event Frequency": {         "low": 20,         "mode": 100,         "high": 900     },     "Loss Magnitude": {         "low": 3000000,         "mode": 3500000,         "high": 5000000     },     "name": "Regular Model 1",     "n_simulations": 10000,     "random_seed": 42,     "model_uuid": "b6c6c968-a03c-11e9-a5db-f26e0bbd6dbc",     "type": "FairModel",     "creation_date": "2019-07-06 17:23:43.647370" }'
     META_MODEL_JSON = '{     "Regular Model 1": {         "Loss Event Frequency": {             "low": 20,             "mode": 100,             "high": 900         },         "Loss Magnitude": {             "low": 3000000,             "mode": 3500000,             "high": 5000000         },         "name": "Regular Model 1",         "n_simulations": 10000,         "random_seed": 42,         "model_uuid": "b6c6c968-a03c-11e9-a5db-f26e0bbd6dbc",         "type": "FairModel",         "creation_date": "2019-07-06 17:23:43.647370"     },     "Regular Model 2": {         "Loss Event Frequency": {             "mean": 0.3,             "stdev": 0.1         },         "Loss Magnitude": {             "low": 2000000000,             "mode": 3000000000,             "high": 5000000000         },         "name": "Regular Model 2",         "n_simulations": 10000,         "random_seed": 42,         "model_uuid": "b6ca98a4-a03c-11e9-8ce0-f26e0bbd6dbc",         "type": "FairModel",         "creation_date": "2019-07-06 17:23:43.672336"     },     "name": "My Meta Model!",     "model_uuid": "b6cce298-a03c-11e9-b79f-f26e0bbd6dbc",     "creation_date": "2019-07-06 17:23:43.687336",     "type": "FairMetaModel" }'
 
+    @classmethod
+    def setUpClass(cls):
+        # Calculated model shared by the read-only export tests
+        cls._calculated_model = FairModel('Test', cls.N_SAMPLES)
+        cls._calculated_model.bulk_import_data({
+            'Loss Magnitude': {'constant': 100},
+            'Loss Event Frequency': {'low': 10, 'mode': 15, 'high': 20}
+        })
+        cls._calculated_model.calculate_all()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._calculated_model = None
+
     def test_creation(self):
         """Test basic instantiation."""
         # Create FairModel
@@ -39,6 +51,9 @@ class TestFairModel(unittest.TestCase):
         # Instantiate model
         model = FairModel.read_json(self.MODEL_JSON)
         self.assertTrue(model)
+        # Already parsed data gives the same model
+        parsed_model = FairModel.read_json(json.loads(self.MODEL_JSON))
+        self.assertTrue(parsed_model.export_results().equals(model.export_results()))
         # Ensure metamodel fails
         self.assertRaises(FairException, FairModel.read_json, self.META_MODEL_JSON)
 
@@ -53,6 +68,7 @@ class TestFairModel(unittest.TestCase):
         # Check inspection methods
         model.get_node_statuses()
         model.get_name()
+        self.assertEqual(model.get_creation_date(), model._creation_date)
         model.calculation_completed()
 
     def test_inputs(self):
@@ -97,6 +113,30 @@ class TestFairModel(unittest.TestCase):
         )
         model.calculate_all()
 
+    def test_bulk_import_errors(self):
+        """Check failed bulk imports leave the model unchanged"""
+        model = FairModel('Test', self.N_SAMPLES)
+        # A bad later input means no earlier input is recorded either
+        self.assertRaises(
+            FairException,
+            model.bulk_import_data,
+            {
+                'Loss Event Frequency': {'low': 10, 'mode': 15, 'high': 20},
+                'Loss Magnitude': {'mean': -1, 'stdev': 10},
+            }
+        )
+        self.assertEqual(model.export_params(), {})
+        self.assertEqual(model._tree.nodes['Loss Event Frequency'].status, 'Required')
+        # Abbreviations and full names for the same target conflict
+        self.assertRaises(
+            FairException,
+            model.bulk_import_data,
+            {
+                'LEF': {'constant': 10},
+                'Loss Event Frequency': {'constant': 20},
+            }
+        )
+
     def test_calculation(self):
         """Run a calulate all."""
         # Create model and import data
@@ -110,13 +150,7 @@ class TestFairModel(unittest.TestCase):
 
     def test_exports(self):
         """Test outputs post calculation"""
-        # Create model and calculate
-        model = FairModel('Test', self.N_SAMPLES)
-        model.bulk_import_data({
-            'Loss Magnitude': {'constant': 100},
-            'Loss Event Frequency': {'low': 10, 'mode': 15, 'high': 20}
-        })
-        model.calculate_all()
+        model = self._calculated_model
         # Export results
         results = model.export_results()
         self.assertIsInstance(results, pd.DataFrame)
@@ -1,7 +1,6 @@
 import unittest
 
 import numpy as np
-import pandas as pd
 
 from pyfair.model.model_calc import FairCalculations
 
@@ -9,11 +8,11 @@ from pyfair.model.model_calc import FairCalculations
 class TestFairModelCalc(unittest.TestCase):
 
     # Raw data
-    _CHILD_1_DATA    = pd.Series([1,2,3,4,5])
-    _CHILD_2_DATA    = pd.Series([5,4,3,2,1])
-    _MULT_OUTPUT     = pd.Series([5,8,9,8,5])
-    _ADD_OUTPUT      = pd.Series([6,6,6,6,6])
-    _STEP_OUTPUT     = pd.Series([.4, .4, .4, .4, .4])
+    _CHILD_1_DATA    = np.array([1,2,3,4,5], dtype=np.int64)
+    _CHILD_2_DATA    = np.array([5,4,3,2,1], dtype=np.int64)
+    _MULT_OUTPUT     = np.array([5,8,9,8,5], dtype=np.int64)
+    _ADD_OUTPUT      = np.array([6,6,6,6,6], dtype=np.int64)
+    _STEP_OUTPUT     = np.array([.4, .4, .4, .4, .4])
 
     # Keys
     _MULTIPLICATION_ITEMS = [
@@ -40,7 +39,7 @@ class TestFairModelCalc(unittest.TestCase):
                 self._CHILD_1_DATA, 
                 self._CHILD_2_DATA
             )
-            self.assertTrue(result.equals(self._MULT_OUTPUT))
+            np.testing.assert_array_equal(np.asarray(result), self._MULT_OUTPUT)
 
     def test_addition(self):
         """Test addition keywords and functions"""
@@ -50,7 +49,7 @@ class TestFairModelCalc(unittest.TestCase):
                 self._CHILD_1_DATA, 
                 self._CHILD_2_DATA
             )
-            self.assertTrue(result.equals(self._ADD_OUTPUT))
+            np.testing.assert_array_equal(np.asarray(result), self._ADD_OUTPUT)
 
     def test_step_average(self):
         """Test step function keywords and functions"""
@@ -60,7 +59,7 @@ class TestFairModelCalc(unittest.TestCase):
                 self._CHILD_1_DATA, 
                 self._CHILD_2_DATA
             )
-            self.assertTrue(result.equals(self._STEP_OUTPUT))
+            np.testing.assert_array_equal(np.asarray(result), self._STEP_OUTPUT)
 
 
 if __name__ == '__main__':
@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+
 from pyfair.model.model_input import FairDataInput
 from pyfair.utility.fair_exception import FairException
 
@@ -19,16 +21,19 @@ class TestFairModelInput(unittest.TestCase):
             }
     }
 
-    def setUp(self):
-        self._input = FairDataInput()
+    @classmethod
+    def setUpClass(cls):
+        # Checks do not change state, so one instance is shared
+        cls._input = FairDataInput()
 
-    def tearDown(self):
-        self._input = None
+    @classmethod
+    def tearDownClass(cls):
+        cls._input = None
 
     def test_creation(self):
         """Test creation is proper"""
-        # Check self._le_1_keywords are in parameter map
-        for keyword in self._input._le_1_keywords:
+        # Check self._LE_1_KEYWORDS are in parameter map
+        for keyword in self._input._LE_1_KEYWORDS:
             self.assertTrue(keyword in self._input._parameter_map)
         # Do the same for self._required_keywords
         for keyword_list in self._input._required_keywords.values():
@@ -76,26 +81,66 @@ class TestFairModelInput(unittest.TestCase):
 
     def test_check_generation(self):
         """Run generation tests"""
+        data_input = FairDataInput()
         # Run basic PERT
-        result = self._input.generate('Loss Event Frequency', self._COUNT, low=0, mode=10, high=20)
+        result = data_input.generate('Loss Event Frequency', self._COUNT, low=0, mode=10, high=20)
         self.assertTrue(len(result) == self._COUNT)
         # Basic normal
-        result = self._input.generate('Loss Event Frequency', self._COUNT, mean=20, stdev=5)
+        result = data_input.generate('Loss Event Frequency', self._COUNT, mean=20, stdev=5)
         self.assertTrue(len(result) == self._COUNT)
         # Basic bernoulli
-        result = self._input.generate('Vulnerability', self._COUNT, mean=.5, stdev=.3)
+        result = data_input.generate('Vulnerability', self._COUNT, mean=.5, stdev=.3)
         self.assertTrue(len(result) == self._COUNT)
         # Basic constant
-        result = self._input.generate('Loss Event Frequency', self._COUNT, constant=50)
+        result = data_input.generate('Loss Event Frequency', self._COUNT, constant=50)
         self.assertAlmostEqual(result.mean(), 50)
         # Make sure items are clipped at 0 and 1 where approprriate
-        result = self._input.generate('Probability of Action', self._COUNT, mean=.5, stdev=2)
+        result = data_input.generate('Probability of Action', self._COUNT, mean=.5, stdev=2)
         self.assertTrue(max(result) <= 1)
         self.assertTrue(min(result) >= 0)
     
+    def test_check_generation_bulk(self):
+        """Bulk generation matches one-at-a-time generation"""
+        data_input = FairDataInput()
+        params = {
+            'Threat Event Frequency': {'low': 10, 'mode': 20, 'high': 30},
+            'Vulnerability': {'low': .5, 'mode': .6, 'high': .9, 'gamma': 2},
+            'Primary Loss': {'mean': 100, 'stdev': 10},
+            'Secondary Loss': {'low': 0, 'mode': 5, 'high': 50},
+        }
+        np.random.seed(42)
+        expected = {
+            target: data_input.generate(target, self._COUNT, **kwargs)
+            for target, kwargs
+            in params.items()
+        }
+        expected_supplied = data_input.get_supplied_values()
+        bulk_input = FairDataInput()
+        np.random.seed(42)
+        result = bulk_input.generate_bulk(params, self._COUNT)
+        self.assertEqual(list(result.keys()), list(params.keys()))
+        for target, values in expected.items():
+            self.assertTrue((result[target] == values).all())
+        self.assertEqual(bulk_input.get_supplied_values(), expected_supplied)
+        # Bad parameters still raise, before anything is recorded
+        bad_input = FairDataInput()
+        with self.assertRaises(FairException):
+            bad_input.generate_bulk({
+                'Threat Event Frequency': {'low': 10, 'mode': 20, 'high': 30},
+                'Primary Loss': {'mean': 100, 'stdev': 10},
+                'Vulnerability': {'low': 0, 'mode': 2, 'high': 5},
+            }, self._COUNT)
+        self.assertEqual(bad_input.get_supplied_values(), {})
+
     def test_check_generation_multi(self):
         """Multi was such a terrible idea"""
-        self._input.generate_multi('multi_Secondary Loss', self._COUNT, self._MULTI)
+        data_input = FairDataInput()
+        result = data_input.generate_multi('multi_Secondary Loss', self._COUNT, self._MULTI)
+        self.assertEqual(len(result), self._COUNT)
+        # Targets must supply the same columns
+        mismatched = {**self._MULTI, 'Legal': {'Secondary Loss Event Frequency': {'constant': 2000}}}
+        with self.assertRaises(FairException):
+            data_input.generate_multi('multi_Secondary Loss', self._COUNT, mismatched)
 
 
 if __name__ == '__main__':
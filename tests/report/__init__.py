@@ -0,0 +1,4 @@
+import matplotlib
+
+# Render report figures off-screen so no GUI backend is probed
+matplotlib.use('Agg')
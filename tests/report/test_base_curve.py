@@ -8,6 +8,16 @@ from pyfair.utility.fair_exception import FairException
 
 class TestFairBaseCurve(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # The checks only read the models, so build them once
+        cls._model = FairModel('model')
+        cls._meta = FairMetaModel('meta', models=[cls._model, cls._model])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._model = None
+        cls._meta = None
 
     def setUp(self):
         self._fbc = FairBaseCurve()
@@ -17,15 +27,15 @@ class TestFairBaseCurve(unittest.TestCase):
 
     def test_good_inputs(self):
         """Test base_curve for good inputs"""
-        model = FairModel('model')
-        meta = FairMetaModel('meta', models=[model, model])
+        model = self._model
+        meta = self._meta
         good_list = [model, meta, model]
         for input_item in [model, meta, good_list]:
             self._fbc._input_check(input_item)
 
     def test_bad_inputs(self):
         """Test base_curve for bad inputs."""
-        model = FairModel('model')
+        model = self._model
         bad_input_1 = []
         bad_input_2 = [model, 'a', 1]
         bad_input_3 = 'abc'
@@ -1,3 +1,4 @@
+import io
 import unittest
 
 import matplotlib
@@ -16,25 +17,33 @@ class TestFairBaseReport(unittest.TestCase):
         '<img  src="data:image/png;base64, iVBORw0KGgoAAAAN'
     )
 
-    def setUp(self):
-        self._fbr = FairBaseReport()
-        self._model_1 = FairModel("model1", n_simulations=5)
-        self._model_1.input_data("Risk", mean=100, stdev=5)
-        self._model_1.calculate_all()
-        self._model_2 = FairModel("model2", n_simulations=5)
-        self._model_2.input_data("Risk", mean=1000, stdev=50)
-        self._model_2.calculate_all()
-        self._metamodel = FairMetaModel(
+    @classmethod
+    def setUpClass(cls):
+        # Reports only read the models, so build them once for all tests
+        cls._model_1 = FairModel("model1", n_simulations=5)
+        cls._model_1.input_data("Risk", mean=100, stdev=5)
+        cls._model_1.calculate_all()
+        cls._model_2 = FairModel("model2", n_simulations=5)
+        cls._model_2.input_data("Risk", mean=1000, stdev=50)
+        cls._model_2.calculate_all()
+        cls._metamodel = FairMetaModel(
             name="meta",
-            models=[self._model_1, self._model_2],
+            models=[cls._model_1, cls._model_2],
         )
-        self._metamodel.calculate_all()
+        cls._metamodel.calculate_all()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._model_1 = None
+        cls._model_2 = None
+        cls._metamodel = None
+
+    def setUp(self):
+        self._fbr = FairBaseReport()
 
     def tearDown(self):
         self._fbr = None
-        self._model_1 = None
-        self._model_2 = None
-        self._metamodel = None
+        matplotlib.pyplot.close('all')
 
     def test_input_check(self):
         """Test the validity of the input check"""
@@ -64,6 +73,9 @@ class TestFairBaseReport(unittest.TestCase):
         """Test base64ify"""
         tag = self._fbr.base64ify(self._BASE64_BYTES)
         self.assertEqual(tag, self._BASE64_BYTES_TAG)
+        tag = self._fbr.base64ify(io.BytesIO(self._BASE64_BYTES))
+        self.assertEqual(tag, self._BASE64_BYTES_TAG)
+        self.assertRaises(TypeError, self._fbr.base64ify, 1)
 
     # DO NOT TEST to_html or _construct_output. Those are done by subclass.
 
@@ -72,6 +84,24 @@ class TestFairBaseReport(unittest.TestCase):
         fig = matplotlib.pyplot.figure()
         tag_first_50 = self._fbr._fig_to_img_tag(fig)[:50]
         self.assertEqual(tag_first_50, self._BASE64_FIG_TAG_FIRST_50)
+        # Figure is closed after encoding
+        self.assertFalse(matplotlib.pyplot.fignum_exists(fig.number))
+
+    def test_get_metadata_table(self):
+        """Test metadata table creation"""
+        table = self._fbr._get_metadata_table()
+        self.assertTrue(table.startswith('<table class="dataframe fair_metadata_table">'))
+        for key in ['Author', 'Created', 'PyFair Version', 'Type']:
+            self.assertIn(f'<th>{key}</th>', table)
+        self.assertIn('<td>FairBaseReport</td>', table)
+        # Subsequent calls reuse the rendered table
+        self.assertIs(self._fbr._get_metadata_table(), table)
+
+    def test_get_data_table(self):
+        """Test results table creation"""
+        table = self._fbr._get_data_table(self._model_1)
+        self.assertIn('<th>Risk</th>', table)
+        self.assertEqual(table.count('<td>$'), 5)
 
     def test_get_tree(self):
         """Test tree creation creation"""
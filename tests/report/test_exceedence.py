@@ -3,6 +3,8 @@ import unittest
 import numpy as np
 import pandas as pd
 
+import matplotlib.pyplot as plt
+
 from pyfair.model.model import FairModel
 from pyfair.report.exceedence import FairExceedenceCurves
 
@@ -14,27 +16,34 @@ class TestFairExceedenceCurves(unittest.TestCase):
     _MEAN_QUANTILE = 34
     _MEAN_PERCENT = 66
 
-    def setUp(self):
-        self._model_1 = FairModel('model1', n_simulations=5)
-        self._model_1.input_data('Loss Event Frequency', mean=100, stdev=5)
-        self._model_1.input_data('Loss Magnitude', mean=1000, stdev=50)
-        self._model_1.calculate_all()
+    @classmethod
+    def setUpClass(cls):
+        # Curves only read the model, so build it once for all tests
+        cls._model_1 = FairModel('model1', n_simulations=5)
+        cls._model_1.input_data('Loss Event Frequency', mean=100, stdev=5)
+        cls._model_1.input_data('Loss Magnitude', mean=1000, stdev=50)
+        cls._model_1.calculate_all()
         # Node model or iterable test will be done prior to instantiation
-        self._fec_1 = FairExceedenceCurves(self._model_1)
-        self._fec_2 = FairExceedenceCurves([
-            self._model_1, 
-            self._model_1
+        cls._fec_1 = FairExceedenceCurves(cls._model_1)
+        cls._fec_2 = FairExceedenceCurves([
+            cls._model_1, 
+            cls._model_1
         ])
 
     def tearDown(self):
-        self._model_1 = None
-        self._fec_1 = None
-        self._fec_2 = None
+        plt.close('all')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._model_1 = None
+        cls._fec_1 = None
+        cls._fec_2 = None
 
     def test_generate_image(self):
         """Ensure generate_image() output"""
-        for fec in [self._fec_1, self._fec_2]:
-            fec.generate_image()
+        for label, fec in [('single', self._fec_1), ('iterable', self._fec_2)]:
+            with self.subTest(input=label):
+                fec.generate_image()
 
     def test_prob_data(self):
         """Test quantile generation"""
@@ -1,6 +1,8 @@
 import unittest
 import warnings
 
+import matplotlib.pyplot as plt
+
 from pyfair.model.model import FairModel
 from pyfair.model.meta_model import FairMetaModel
 from pyfair.report.simple_report import FairSimpleReport
@@ -8,6 +10,9 @@ from pyfair.report.simple_report import FairSimpleReport
 
 class TestFairSimpleReport(unittest.TestCase):
 
+    def tearDown(self):
+        plt.close('all')
+
     def test_generate_image(self):
         """Check HTML content can be generated"""
         model_1 = FairModel(name='Model', n_simulations=10)
@@ -22,7 +27,9 @@ class TestFairSimpleReport(unittest.TestCase):
         with warnings.catch_warnings(record=False):
             warnings.simplefilter("ignore")
             fsr = FairSimpleReport([model_1, meta_model_1])
-            _ = fsr._construct_output()
+            output = fsr._construct_output()
+        # Every template placeholder should have been filled
+        self.assertNotRegex(output, r'\{[A-Z_]+\}')
         # There are minor differences in data due to runtime data being
         # inlucded in the output. As of right now there's no easy way to
         # check this data to ensure content doesn't change from run-to-run.
@@ -1,6 +1,8 @@
 import unittest
 import warnings
 
+import matplotlib.pyplot as plt
+
 from pyfair.model.model import FairModel
 from pyfair.report.tree_graph import FairTreeGraph
 
@@ -25,6 +27,9 @@ class TestFairTreeGraph(unittest.TestCase):
         'Secondary Loss Magnitude'       : _DOLLAR_FORMAT_STRING,
     }
 
+    def tearDown(self):
+        plt.close('all')
+
     def test_tree_graph_creation(self):
         """Test tree greaph creation"""
         # There is little to test here other than simple creation
@@ -1,6 +1,8 @@
 import unittest
 import warnings
 
+import matplotlib.pyplot as plt
+
 from pyfair.model.model import FairModel
 from pyfair.model.meta_model import FairMetaModel
 from pyfair.report.violin import FairViolinPlot
@@ -8,6 +10,9 @@ from pyfair.report.violin import FairViolinPlot
 
 class TestFairViolinPlot(unittest.TestCase):
 
+    def tearDown(self):
+        plt.close('all')
+
     def test_tree_graph_creation(self):
         """Test violin plot creation"""
         # There is little to test here other than simple creation
@@ -1,4 +1,5 @@
 import pathlib
+import tempfile
 import unittest
 
 from pyfair.model.meta_model import FairMetaModel
@@ -31,12 +32,16 @@ class TestFairDatabase(unittest.TestCase):
     """
 
     def setUp(self):
-        # sqlite does not seem to like tempfile
-        self._tf = pathlib.Path().home() / 'pyfair_test.sqlite'
+        # sqlite needs its own path (plus -wal/-shm files), so use a
+        # temporary directory rather than an open temporary file
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self._tf = pathlib.Path(self._tmpdir.name) / 'pyfair_test.sqlite'
         self._db = FairDatabase(str(self._tf))
 
     def tearDown(self):
-        self._tf.unlink()
+        self._db.close()
+        self._tmpdir.cleanup()
+        self._tmpdir = None
         self._tf = None
         self._db = None
 
@@ -70,13 +75,79 @@ class TestFairDatabase(unittest.TestCase):
         # For load via all stirngs
         for string in load_strings:
             _ = self._db.load(string)
+        # Load directly when the kind of identifier is known
+        self.assertEqual(self._db.load_by_name(model_name).get_uuid(), model_uuid)
+        self.assertEqual(self._db.load_by_uuid(meta_model_uuid).get_name(), meta_model_name)
+        self.assertRaises(FairException, self._db.load_by_name, 'missing')
         # Confirm query is working
         result = self._db.query(
             self._QUERY_STRING,
             (model_uuid,)
         )
         self.assertTrue(len(result) == 1)
+        # Store several at once with a single held connection
+        with self._db as db:
+            db.store_many([model, metamodel])
+            self.assertTrue(len(db.query('SELECT uuid FROM models')) == 2)
+        self.assertRaises(FairException, self._db.store_many, [model, FairModel('uncalculated')])
+        # Compacting keeps the stored models
+        self._db.compact()
+        self.assertTrue(len(self._db.query(self._QUERY_STRING, (model_uuid,))) == 1)
+        # Query results are plain rows after loads
+        self.assertIsInstance(result[0], tuple)
 
 
+    def test_load_cache(self):
+        """Test repeated loads are cached until the database changes"""
+        model = FairModel('model')
+        model.bulk_import_data(self._BULK_IMPORT_DATA)
+        model.calculate_all()
+        self._db.store(model)
+        first = self._db.load('model')
+        second = self._db.load('model')
+        self.assertIsNot(first, second)
+        self.assertTrue(first.export_results().equals(second.export_results()))
+        # Storing a changed model with the same UUID invalidates the cache
+        changed = FairModel('model', model_uuid=model.get_uuid(), creation_date='now')
+        changed.input_data('Risk', constant=1)
+        changed.calculate_all()
+        self._db.store(changed)
+        self.assertTrue((self._db.load(model.get_uuid()).export_results()['Risk'] == 1).all())
+
+    def test_load_metamodel(self):
+        """Test loaded metamodels are calculated"""
+        model = FairModel('model')
+        model.bulk_import_data(self._BULK_IMPORT_DATA)
+        model.calculate_all()
+        metamodel = FairMetaModel('meta', models=[model, model])
+        metamodel.calculate_all()
+        self._db.store(metamodel)
+        # Repeat to cover the cached copy as well
+        for _ in range(2):
+            loaded = self._db.load('meta')
+            self.assertTrue(loaded.calculation_completed())
+            self.assertTrue(loaded.export_results()['Risk'].equals(metamodel.export_results()['Risk']))
+
+    def test_numeric_name(self):
+        """Test names that look like numbers are kept as text"""
+        model = FairModel('0123')
+        model.input_data('Risk', constant=1)
+        model.calculate_all()
+        self._db.store(model)
+        self.assertEqual(self._db.query('SELECT name FROM models')[0][0], '0123')
+        self.assertEqual(self._db.load('0123').get_uuid(), model.get_uuid())
+
+    def test_large_model_compression(self):
+        """Test large models are compressed and load correctly"""
+        model = FairModel('raw', n_simulations=10_000)
+        model.input_raw_data('Loss Event Frequency', list(range(10_000)))
+        model.input_data('Loss Magnitude', constant=10)
+        model.calculate_all()
+        self._db.store(model)
+        stored = self._db.query('SELECT json FROM models')[0][0]
+        self.assertIsInstance(stored, bytes)
+        loaded = self._db.load(model.get_uuid())
+        self.assertTrue(loaded.export_results().equals(model.export_results()))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -26,6 +26,45 @@ class TestFairFactory(unittest.TestCase):
         # Generate
         model = self._fac.generate_from_partial("name", self._VARIABLE_ARGS_1)
         self.assertIsInstance(model, FairModel)
+        # Same as building the model from scratch, but with its own identity
+        scratch = FairModel("name")
+        scratch.bulk_import_data({**self._STATIC_ARGS, **self._VARIABLE_ARGS_1})
+        scratch.calculate_all()
+        self.assertTrue(model.export_results().equals(scratch.export_results()))
+        other = self._fac.generate_from_partial("other", self._VARIABLE_ARGS_2)
+        self.assertEqual(other.get_name(), "other")
+        self.assertNotEqual(model.get_uuid(), other.get_uuid())
+
+    def test_gen_unseeded(self):
+        """Test unseeded models do not share their random draws"""
+        fac = FairModelFactory(
+            {"Loss Magnitude": {"low": 10, "mode": 20, "high": 30}},
+            random_seed=None,
+        )
+        model = fac.generate_from_partial("model", self._VARIABLE_ARGS_1)
+        other = fac.generate_from_partial("other", self._VARIABLE_ARGS_1)
+        self.assertTrue(other.calculation_completed())
+        self.assertFalse(model.export_results().equals(other.export_results()))
+
+    def test_gen_with_multi(self):
+        """Test multi arguments are passed through to the model"""
+        fac = FairModelFactory({
+            "Loss Event Frequency": {"constant": 10},
+            "Primary Loss": {"low": 10, "mode": 20, "high": 30},
+            "multi_Secondary Loss": {
+                "Reputational": {
+                    "Secondary Loss Event Frequency": {"constant": 4},
+                    "Secondary Loss Event Magnitude": {"low": 10, "mode": 20, "high": 100},
+                },
+                "Legal": {
+                    "Secondary Loss Event Frequency": {"constant": 2},
+                    "Secondary Loss Event Magnitude": {"low": 10, "mode": 20, "high": 100},
+                },
+            },
+        })
+        model = fac.generate_from_partial("multi", {})
+        self.assertTrue(model.calculation_completed())
+        self.assertIn("multi_Secondary Loss", model.export_params())
 
     def test_gen_from_partials(self):
         """Test generation of multiple items via factory"""
@@ -37,6 +76,18 @@ class TestFairFactory(unittest.TestCase):
         for model in models:
             self.assertIsInstance(model, FairModel)
 
+    def test_gen_from_partials_parallel(self):
+        """Test parallel generation matches sequential generation"""
+        models = self._fac.generate_from_partials(self._VARIABLE_ARGS_DICT)
+        parallel_models = self._fac.generate_from_partials(
+            self._VARIABLE_ARGS_DICT,
+            max_workers=2,
+        )
+        for model, parallel_model in zip(models, parallel_models):
+            self.assertEqual(model.get_name(), parallel_model.get_name())
+            self.assertTrue(parallel_model.calculation_completed())
+            self.assertTrue(model.export_results().equals(parallel_model.export_results()))
+
 
 if __name__ == "__main__":
     unittest.main()